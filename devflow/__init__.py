@@ -1,3 +1,20 @@
 """devflow - A Python-native project operations CLI."""
 
-__version__ = "0.1.0"
+from __future__ import annotations
+
+from typing import Any
+
+__all__ = ["__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily resolve package attributes (PEP 562).
+
+    ``__version__`` lives in ``devflow._version`` and is only imported
+    when it is actually requested.
+    """
+    if name == "__version__":
+        from devflow._version import __version__
+
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
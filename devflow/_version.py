@@ -0,0 +1,3 @@
+"""Version information for devflow."""
+
+__version__ = "0.1.0"
@@ -12,11 +12,13 @@ This module provides the AppContext which encapsulates:
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from devflow.config import DevflowConfig, load_config
+from devflow.core.compat import DATACLASS_SLOTS
 from devflow.core.paths import ProjectRootNotFoundError, find_project_root
 
 if TYPE_CHECKING:
@@ -30,9 +32,111 @@ VERBOSITY_VERBOSE = 1
 VERBOSITY_DEBUG = 2
 
 
+class _StderrHandler(logging.StreamHandler):  # type: ignore[type-arg]
+    """StreamHandler that always writes to the current ``sys.stderr``.
+
+    Resolving the stream at emit time lets a single module-level handler
+    follow stream redirection (e.g. test capture) without being rebuilt.
+    """
+
+    def __init__(self) -> None:
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self) -> Any:  # type: ignore[override]
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value: Any) -> None:
+        pass
+
+
+# Shared handler and formatters, built once at import time
+_HANDLER = _StderrHandler()
+_FMT_PLAIN = logging.Formatter("%(message)s")
+_FMT_DEBUG = logging.Formatter("%(levelname)s [%(name)s] %(message)s")
+
+
+def _level_for_verbosity(verbosity: int) -> int:
+    """Map a verbosity level to a logging level.
+
+    Args:
+        verbosity: Verbosity level (-1=quiet, 0=default, 1=verbose, 2=debug)
+
+    Returns:
+        The corresponding ``logging`` level.
+    """
+    if verbosity <= VERBOSITY_QUIET:
+        return logging.WARNING
+    if verbosity == VERBOSITY_DEFAULT:
+        return logging.INFO
+    return logging.DEBUG  # VERBOSITY_VERBOSE or higher
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Discard a log call."""
+
+
+class FastLogger:
+    """Minimal logger that writes plain messages straight to stderr.
+
+    Used instead of the stdlib ``logging`` machinery below debug verbosity,
+    where output is just the message text: no LogRecord is built and no
+    handler or formatter runs. Exposes the subset of the ``logging.Logger``
+    interface that devflow uses.
+
+    The level is fixed at construction: when debug output is disabled,
+    ``debug`` is bound to a no-op so disabled calls skip even the level
+    check.
+
+    Attributes:
+        name: Logger name, always ``devflow``.
+        level: Minimum ``logging`` level that is written.
+        debug: Writes a debug message, or discards it when disabled.
+    """
+
+    __slots__ = ("name", "level", "debug")
+
+    def __init__(self, level: int = logging.INFO) -> None:
+        """Initialize the logger.
+
+        Args:
+            level: Minimum ``logging`` level that is written.
+        """
+        self.name = "devflow"
+        self.level = level
+        self.debug: Callable[..., None] = self._debug if level <= logging.DEBUG else _noop
+
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802 - mirrors logging.Logger
+        """Return whether messages at the given level are written."""
+        return level >= self.level
+
+    def _write(self, level: int, msg: str, args: tuple[Any, ...]) -> None:
+        if level >= self.level:
+            sys.stderr.write((msg % args if args else msg) + "\n")
+
+    def _debug(self, msg: str, *args: Any) -> None:
+        sys.stderr.write((msg % args if args else msg) + "\n")
+
+    def info(self, msg: str, *args: Any) -> None:
+        """Write an informational message."""
+        self._write(logging.INFO, msg, args)
+
+    def warning(self, msg: str, *args: Any) -> None:
+        """Write a warning message."""
+        self._write(logging.WARNING, msg, args)
+
+    def error(self, msg: str, *args: Any) -> None:
+        """Write an error message."""
+        self._write(logging.ERROR, msg, args)
+
+
 def setup_logging(verbosity: int = VERBOSITY_DEFAULT) -> logging.Logger:
     """Set up and return the devflow logger with appropriate level.
 
+    The same handler instance is reused across calls, so repeated setup
+    never stacks handlers on the ``devflow`` logger.
+
     Args:
         verbosity: Verbosity level (-1=quiet, 0=default, 1=verbose, 2=debug)
 
@@ -40,50 +144,61 @@ def setup_logging(verbosity: int = VERBOSITY_DEFAULT) -> logging.Logger:
         Configured logger instance.
     """
     logger = logging.getLogger("devflow")
-
-    # Clear any existing handlers
-    logger.handlers.clear()
-
-    # Set level based on verbosity
-    if verbosity <= VERBOSITY_QUIET:
-        level = logging.WARNING
-    elif verbosity == VERBOSITY_DEFAULT:
-        level = logging.INFO
-    elif verbosity == VERBOSITY_VERBOSE:
-        level = logging.DEBUG
-    else:  # VERBOSITY_DEBUG or higher
-        level = logging.DEBUG
+    level = _level_for_verbosity(verbosity)
 
     logger.setLevel(level)
+    _HANDLER.setLevel(level)
+    _HANDLER.setFormatter(_FMT_DEBUG if verbosity >= VERBOSITY_DEBUG else _FMT_PLAIN)
 
-    # Create console handler with formatting
-    handler = logging.StreamHandler()
-    handler.setLevel(level)
-
-    # Format with phase prefix support
-    if verbosity >= VERBOSITY_DEBUG:
-        formatter = logging.Formatter("%(levelname)s [%(name)s] %(message)s")
-    else:
-        formatter = logging.Formatter("%(message)s")
-
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    if logger.handlers != [_HANDLER]:
+        logger.handlers.clear()
+        logger.addHandler(_HANDLER)
     # Prevent log messages from propagating to parent loggers
     logger.propagate = False
     return logger
 
 
-@dataclass
+# Bracketed prefixes for the built-in phases, built once
+_PHASE_PREFIXES = {
+    phase: f"[{phase}] "
+    for phase in (
+        "venv", "deps", "test", "build", "publish", "git", "version", "task", "completion"
+    )
+}
+
+
+def _with_phase(message: str, phase: str | None) -> str:
+    """Prefix a log message with its phase tag, e.g. ``[test] message``.
+
+    Args:
+        message: The message to log.
+        phase: Optional phase name.
+
+    Returns:
+        The message, prefixed when a phase is given.
+    """
+    if not phase:
+        return message
+    prefix = _PHASE_PREFIXES.get(phase)
+    if prefix is None:
+        prefix = f"[{phase}] "
+    return prefix + message
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AppContext:
     """Application context encapsulating runtime state.
 
     This is the central state object passed to all commands and tasks.
     Other workstreams should import and use this class, not redefine it.
 
+    Instances are immutable; use ``dataclasses.replace`` to derive a
+    modified context.
+
     Attributes:
         project_root: Path to the project root directory.
         config: Loaded and merged DevflowConfig.
-        logger: Configured logger instance.
+        logger: Configured logger instance (a FastLogger below debug verbosity).
         verbosity: Current verbosity level.
         dry_run: Whether to run in dry-run mode (no side effects).
         command_registry: Registry of available commands (provided by Workstream B).
@@ -91,7 +206,7 @@ class AppContext:
 
     project_root: Path
     config: DevflowConfig
-    logger: logging.Logger
+    logger: logging.Logger | FastLogger
     verbosity: int = VERBOSITY_DEFAULT
     dry_run: bool = False
     command_registry: Any = field(default=None)  # Type: CommandRegistry from Workstream B
@@ -103,6 +218,7 @@ class AppContext:
         config_path: Path | str | None = None,
         verbosity: int = VERBOSITY_DEFAULT,
         dry_run: bool = False,
+        use_cache: bool = True,
     ) -> AppContext:
         """Create an AppContext by detecting project root and loading config.
 
@@ -113,6 +229,7 @@ class AppContext:
             config_path: Override for config file path. If None, auto-discover.
             verbosity: Verbosity level for logging.
             dry_run: Whether to run in dry-run mode.
+            use_cache: Whether to use cached project-root and config results.
 
         Returns:
             Configured AppContext instance.
@@ -120,8 +237,13 @@ class AppContext:
         Raises:
             ProjectRootNotFoundError: If project root cannot be detected.
         """
-        # Set up logging first
-        logger = setup_logging(verbosity)
+        # Set up logging first; full stdlib logging is only needed for the
+        # debug format, plain output goes through the lightweight writer
+        logger: logging.Logger | FastLogger
+        if verbosity >= VERBOSITY_DEBUG:
+            logger = setup_logging(verbosity)
+        else:
+            logger = FastLogger(_level_for_verbosity(verbosity))
 
         # Resolve project root
         if project_root is not None:
@@ -130,20 +252,18 @@ class AppContext:
                 raise FileNotFoundError(f"Specified project root does not exist: {root}")
         else:
             try:
-                root = find_project_root()
+                root = find_project_root(use_cache=use_cache)
             except ProjectRootNotFoundError:
                 # If no project root found and we're in a directory without markers,
                 # use current directory but warn
                 root = Path.cwd().resolve()
-                logger.warning(
-                    f"No project root markers found, using current directory: {root}"
-                )
+                logger.warning("No project root markers found, using current directory: %s", root)
 
         # Resolve config path if provided
         explicit_config = Path(config_path).resolve() if config_path else None
 
         # Load configuration
-        config = load_config(root, explicit_config)
+        config = load_config(root, explicit_config, use_cache=use_cache)
 
         return cls(
             project_root=root,
@@ -160,10 +280,9 @@ class AppContext:
             message: The message to log.
             phase: Optional phase prefix (e.g., 'test', 'build').
         """
-        if phase:
-            self.logger.info(f"[{phase}] {message}")
-        else:
-            self.logger.info(message)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info(_with_phase(message, phase))
 
     def debug(self, message: str, phase: str | None = None) -> None:
         """Log a debug message with optional phase prefix.
@@ -172,10 +291,9 @@ class AppContext:
             message: The message to log.
             phase: Optional phase prefix.
         """
-        if phase:
-            self.logger.debug(f"[{phase}] {message}")
-        else:
-            self.logger.debug(message)
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self.logger.debug(_with_phase(message, phase))
 
     def error(self, message: str, phase: str | None = None) -> None:
         """Log an error message with optional phase prefix.
@@ -184,10 +302,7 @@ class AppContext:
             message: The error message to log.
             phase: Optional phase prefix.
         """
-        if phase:
-            self.logger.error(f"[{phase}] {message}")
-        else:
-            self.logger.error(message)
+        self.logger.error(_with_phase(message, phase))
 
     def warning(self, message: str, phase: str | None = None) -> None:
         """Log a warning message with optional phase prefix.
@@ -196,7 +311,4 @@ class AppContext:
             message: The warning message to log.
             phase: Optional phase prefix.
         """
-        if phase:
-            self.logger.warning(f"[{phase}] {message}")
-        else:
-            self.logger.warning(message)
+        self.logger.warning(_with_phase(message, phase))
@@ -2,346 +2,543 @@
 
 This module provides the main CLI interface using Typer.
 It implements global flags and dispatches to subcommands.
+
+Typer and the application layer are imported lazily: the Typer app is
+only constructed by ``_get_app()`` on first use, so importing this module
+(or printing the version) does not pay for the full import graph.
+``devflow.cli.app`` remains available as a lazily built module attribute.
+
+Each top-level command is registered by its own ``_register_*`` function
+listed in ``_COMMAND_TABLE``. The ``cli()`` entry point sniffs the
+subcommand from ``sys.argv`` and only registers that one.
+
+Note: this module intentionally does not use ``from __future__ import
+annotations``. The command callbacks are defined inside the register
+functions, and Typer resolves their annotations at runtime, so they must
+be real objects rather than strings referring to function-local names.
 """
 
-from __future__ import annotations
+import functools
+import os
+import sys
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Optional
 
-from pathlib import Path
+if TYPE_CHECKING:
+    from typing import Any, Callable, Final
 
-import typer
+    import typer
 
-from devflow import __version__
-from devflow.app import (
-    VERBOSITY_DEBUG,
-    VERBOSITY_DEFAULT,
-    VERBOSITY_QUIET,
-    VERBOSITY_VERBOSE,
-    AppContext,
+    from devflow.app import AppContext
+
+# Per-context state for the CLI. The AppContext is built on first use from
+# the factory installed by the main callback, so flags that exit early
+# (--version, --help) never resolve the project root or load config.
+# ContextVars keep concurrent invocations (threads, asyncio tasks) apart.
+_app_context: "ContextVar[Optional[AppContext]]" = ContextVar(
+    "devflow_app_context", default=None
 )
-from devflow.core.paths import ProjectRootNotFoundError
-
-# Create the main Typer app
-app = typer.Typer(
-    name="devflow",
-    help="A Python-Native Project Operations CLI",
-    no_args_is_help=False,
-    add_completion=True,
+_context_factory: "ContextVar[Optional[Callable[[], AppContext]]]" = ContextVar(
+    "devflow_context_factory", default=None
 )
 
-# Global state for context
-_app_context: AppContext | None = None
+
+def _version_text() -> str:
+    """Return the text printed by ``devflow --version``."""
+    from devflow._version import __version__
+
+    return f"devflow version {__version__}"
 
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
-        typer.echo(f"devflow version {__version__}")
+        import typer
+
+        typer.echo(_version_text())
         raise typer.Exit()
 
 
-def get_context() -> AppContext:
-    """Get the current application context."""
-    if _app_context is None:
-        raise RuntimeError("AppContext not initialized")
-    return _app_context
-
-
-@app.callback(invoke_without_command=True)
-def main(
-    ctx: typer.Context,
-    config: Path | None = typer.Option(
-        None,
-        "--config",
-        "-c",
-        help="Path to configuration file",
-        exists=False,  # We handle existence check ourselves
-    ),
-    project_root: Path | None = typer.Option(
-        None,
-        "--project-root",
-        "-p",
-        help="Override project root directory",
-        exists=False,  # We handle existence check ourselves
-    ),
-    verbose: int = typer.Option(
-        0,
-        "--verbose",
-        "-v",
-        count=True,
-        help="Increase verbosity (-v for verbose, -vv for debug)",
-    ),
-    quiet: bool = typer.Option(
-        False,
-        "--quiet",
-        "-q",
-        help="Suppress output (only show warnings and errors)",
-    ),
-    dry_run: bool = typer.Option(
-        False,
-        "--dry-run",
-        "-n",
-        help="Show what would be done without executing",
-    ),
-    version: bool = typer.Option(
-        False,
-        "--version",
-        callback=version_callback,
-        is_eager=True,
-        help="Show version and exit",
-    ),
-) -> None:
-    """devflow - A Python-Native Project Operations CLI.
-
-    Replace per-project shell scripts with a single, configurable CLI.
-    """
-    global _app_context
-
-    # Calculate verbosity level
-    if quiet:
-        verbosity = VERBOSITY_QUIET
-    elif verbose >= 2:
-        verbosity = VERBOSITY_DEBUG
-    elif verbose == 1:
-        verbosity = VERBOSITY_VERBOSE
-    else:
-        verbosity = VERBOSITY_DEFAULT
-
-    try:
-        _app_context = AppContext.create(
-            project_root=project_root,
-            config_path=config,
-            verbosity=verbosity,
-            dry_run=dry_run,
-        )
-    except ProjectRootNotFoundError as e:
-        typer.echo(f"Error: {e}", err=True)
-        raise typer.Exit(1) from None
-    except FileNotFoundError as e:
-        typer.echo(f"Error: {e}", err=True)
-        raise typer.Exit(1) from None
-
-    # If no command is invoked, show help with available commands
-    if ctx.invoked_subcommand is None:
-        _show_available_commands(ctx)
+def get_context() -> "AppContext":
+    """Get the current application context, creating it on first access.
 
+    Raises:
+        RuntimeError: If the main callback has not run yet.
+    """
+    app_context = _app_context.get()
+    if app_context is None:
+        factory = _context_factory.get()
+        if factory is None:
+            raise RuntimeError("AppContext not initialized")
+        app_context = factory()
+        _app_context.set(app_context)
+    return app_context
+
+
+# Static part of the bare `devflow` overview, rendered once at import time
+_BUILTIN_COMMANDS: "Final[tuple[tuple[str, str], ...]]" = (
+    ("venv", "Manage project virtual environment"),
+    ("deps", "Manage dependencies (sync, freeze)"),
+    ("test", "Run tests"),
+    ("build", "Build distribution artifacts"),
+    ("publish", "Build & upload to package index"),
+    ("git", "Git-related helper commands"),
+    ("task", "Run custom tasks defined in config"),
+    ("version", "Show project version"),
+)
 
-def _show_available_commands(ctx: typer.Context) -> None:
-    """Show available commands and project-specific tasks."""
-    typer.echo("devflow - A Python-Native Project Operations CLI")
-    typer.echo()
-    typer.echo("Available commands:")
-    typer.echo()
-
-    # List built-in commands
-    commands = [
-        ("venv", "Manage project virtual environment"),
-        ("deps", "Manage dependencies (sync, freeze)"),
-        ("test", "Run tests"),
-        ("build", "Build distribution artifacts"),
-        ("publish", "Build & upload to package index"),
-        ("git", "Git-related helper commands"),
-        ("task", "Run custom tasks defined in config"),
-        ("version", "Show project version"),
+_OVERVIEW_TEXT: "Final[str]" = "\n".join(
+    [
+        "devflow - A Python-Native Project Operations CLI",
+        "",
+        "Available commands:",
+        "",
+        *(f"  {cmd:12} {desc}" for cmd, desc in _BUILTIN_COMMANDS),
+        "",
+        "Use 'devflow <command> --help' for more information about a command.",
     ]
+)
 
-    for cmd, desc in commands:
-        typer.echo(f"  {cmd:12} {desc}")
 
-    typer.echo()
-    typer.echo("Use 'devflow <command> --help' for more information about a command.")
+def _show_available_commands(ctx: "typer.Context") -> None:
+    """Show available commands and project-specific tasks."""
+    import typer
 
-    # Show project-specific tasks if available
-    if _app_context and _app_context.config.tasks:
-        typer.echo()
-        typer.echo("Project-specific tasks:")
-        typer.echo()
-        for task_name in _app_context.config.tasks:
-            typer.echo(f"  {task_name}")
+    # Emit the whole listing in a single write
+    tasks = get_context().config.tasks
+    if tasks:
+        task_lines = "\n".join(f"  {task_name}" for task_name in tasks)
+        typer.echo(f"{_OVERVIEW_TEXT}\n\nProject-specific tasks:\n\n{task_lines}")
+    else:
+        typer.echo(_OVERVIEW_TEXT)
+
+
+def _register_main(app: "typer.Typer") -> None:
+    """Register the global callback that handles the top-level flags."""
+    from pathlib import Path
+
+    import typer
+
+    @app.callback(invoke_without_command=True)
+    def main(
+        ctx: typer.Context,
+        config: Optional[Path] = typer.Option(
+            None,
+            "--config",
+            "-c",
+            help="Path to configuration file",
+            exists=False,  # We handle existence check ourselves
+        ),
+        project_root: Optional[Path] = typer.Option(
+            None,
+            "--project-root",
+            "-p",
+            help="Override project root directory",
+            exists=False,  # We handle existence check ourselves
+        ),
+        verbose: int = typer.Option(
+            0,
+            "--verbose",
+            "-v",
+            count=True,
+            help="Increase verbosity (-v for verbose, -vv for debug)",
+        ),
+        quiet: bool = typer.Option(
+            False,
+            "--quiet",
+            "-q",
+            help="Suppress output (only show warnings and errors)",
+        ),
+        dry_run: bool = typer.Option(
+            False,
+            "--dry-run",
+            "-n",
+            help="Show what would be done without executing",
+        ),
+        no_cache: bool = typer.Option(
+            False,
+            "--no-cache",
+            help="Ignore cached project-root and config results",
+        ),
+        version: bool = typer.Option(
+            False,
+            "--version",
+            "-V",
+            callback=version_callback,
+            is_eager=True,
+            help="Show version and exit",
+        ),
+    ) -> None:
+        """devflow - A Python-Native Project Operations CLI.
+
+        Replace per-project shell scripts with a single, configurable CLI.
+        """
+        def create_context() -> "AppContext":
+            # The app layer (config loading, TOML parsing) is only imported
+            # once a command actually needs the context
+            from devflow.app import (
+                VERBOSITY_DEBUG,
+                VERBOSITY_DEFAULT,
+                VERBOSITY_QUIET,
+                VERBOSITY_VERBOSE,
+                AppContext,
+            )
+            from devflow.core.paths import ProjectRootNotFoundError
+
+            # Calculate verbosity level
+            if quiet:
+                verbosity = VERBOSITY_QUIET
+            elif verbose >= 2:
+                verbosity = VERBOSITY_DEBUG
+            elif verbose == 1:
+                verbosity = VERBOSITY_VERBOSE
+            else:
+                verbosity = VERBOSITY_DEFAULT
+
+            try:
+                return AppContext.create(
+                    project_root=project_root,
+                    config_path=config,
+                    verbosity=verbosity,
+                    dry_run=dry_run,
+                    use_cache=not no_cache,
+                )
+            except (ProjectRootNotFoundError, FileNotFoundError) as e:
+                typer.echo(f"Error: {e}", err=True)
+                raise typer.Exit(1) from None
+
+        # Defer creation until a command actually needs the context
+        _app_context.set(None)
+        _context_factory.set(create_context)
+
+        # If no command is invoked, show help with available commands
+        if ctx.invoked_subcommand is None:
+            _show_available_commands(ctx)
 
 
 # ============================================================================
 # Placeholder subcommands (implementations owned by other workstreams)
 # ============================================================================
 
-# Workstream C: Venv commands
-venv_app = typer.Typer(help="Manage project virtual environment")
-app.add_typer(venv_app, name="venv")
-
-
-@venv_app.command("init")
-def venv_init(
-    python: str | None = typer.Option(
-        None,
-        "--python",
-        help="Python interpreter to use",
-    ),
-    recreate: bool = typer.Option(
-        False,
-        "--recreate",
-        help="Delete and recreate venv",
-    ),
-) -> None:
-    """Create or initialize project virtual environment.
-
-    Implementation owned by Workstream C.
-    """
-    ctx = get_context()
-    ctx.log("venv init: Not yet implemented (Workstream C)", phase="venv")
-    if ctx.dry_run:
-        ctx.log("Would create venv", phase="venv")
 
+def _register_venv(app: "typer.Typer") -> None:
+    """Workstream C: Venv commands."""
+    import typer
+
+    venv_app = typer.Typer(help="Manage project virtual environment")
+    app.add_typer(venv_app, name="venv")
+
+    @venv_app.command("init")
+    def venv_init(
+        python: Optional[str] = typer.Option(
+            None,
+            "--python",
+            help="Python interpreter to use",
+        ),
+        recreate: bool = typer.Option(
+            False,
+            "--recreate",
+            help="Delete and recreate venv",
+        ),
+    ) -> None:
+        """Create or initialize project virtual environment.
+
+        Implementation owned by Workstream C.
+        """
+        ctx = get_context()
+        ctx.log("venv init: Not yet implemented (Workstream C)", phase="venv")
+        if ctx.dry_run:
+            ctx.log("Would create venv", phase="venv")
+
+
+def _register_deps(app: "typer.Typer") -> None:
+    """Workstream C: Deps commands."""
+    import typer
+
+    deps_app = typer.Typer(help="Manage dependencies")
+    app.add_typer(deps_app, name="deps")
+
+    @deps_app.command("sync")
+    def deps_sync() -> None:
+        """Synchronize dependencies from requirements.
+
+        Implementation owned by Workstream C.
+        """
+        ctx = get_context()
+        ctx.log("deps sync: Not yet implemented (Workstream C)", phase="deps")
+
+    @deps_app.command("freeze")
+    def deps_freeze() -> None:
+        """Freeze installed packages to requirements file.
+
+        Implementation owned by Workstream C.
+        """
+        ctx = get_context()
+        ctx.log("deps freeze: Not yet implemented (Workstream C)", phase="deps")
+
+
+def _register_test(app: "typer.Typer") -> None:
+    """Workstream D: Test command."""
+    import typer
+
+    @app.command()
+    def test(
+        pattern: Optional[str] = typer.Option(
+            None,
+            "--pattern",
+            "-k",
+            help="Test name pattern to match",
+        ),
+        marker: Optional[str] = typer.Option(
+            None,
+            "--marker",
+            "-m",
+            help="Only run tests with given marker",
+        ),
+        cov: bool = typer.Option(
+            False,
+            "--cov",
+            help="Run with coverage",
+        ),
+    ) -> None:
+        """Run tests.
+
+        Implementation owned by Workstream D.
+        """
+        ctx = get_context()
+        ctx.log("test: Not yet implemented (Workstream D)", phase="test")
+
+
+def _register_build(app: "typer.Typer") -> None:
+    """Workstream D: Build command."""
+
+    @app.command()
+    def build() -> None:
+        """Build distribution artifacts.
+
+        Implementation owned by Workstream D.
+        """
+        ctx = get_context()
+        ctx.log("build: Not yet implemented (Workstream D)", phase="build")
+
+
+def _register_publish(app: "typer.Typer") -> None:
+    """Workstream D: Publish command."""
+    import typer
+
+    @app.command()
+    def publish(
+        repository: Optional[str] = typer.Option(
+            None,
+            "--repository",
+            "-r",
+            help="Target repository (pypi, testpypi, or custom)",
+        ),
+        skip_tests: bool = typer.Option(
+            False,
+            "--skip-tests",
+            help="Skip running tests before publish",
+        ),
+        allow_dirty: bool = typer.Option(
+            False,
+            "--allow-dirty",
+            help="Allow publishing with uncommitted changes",
+        ),
+    ) -> None:
+        """Build and upload to package index.
+
+        Implementation owned by Workstream D.
+        """
+        ctx = get_context()
+        ctx.log("publish: Not yet implemented (Workstream D)", phase="publish")
+
+
+def _register_git(app: "typer.Typer") -> None:
+    """Workstream E: Git commands."""
+    import typer
+
+    git_app = typer.Typer(help="Git-related helper commands")
+    app.add_typer(git_app, name="git")
+
+    @git_app.command("status")
+    def git_status() -> None:
+        """Show git status relevant to devflow.
+
+        Implementation owned by Workstream E.
+        """
+        ctx = get_context()
+        ctx.log("git status: Not yet implemented (Workstream E)", phase="git")
+
+
+def _register_version(app: "typer.Typer") -> None:
+    """Workstream E: Version command."""
+
+    @app.command("version")
+    def show_version() -> None:
+        """Show project version.
+
+        Implementation owned by Workstream E.
+        """
+        ctx = get_context()
+        ctx.log("version: Not yet implemented (Workstream E)", phase="version")
+
+
+def _register_task(app: "typer.Typer") -> None:
+    """Workstream B: Task command."""
+    import typer
+
+    @app.command()
+    def task(
+        name: Optional[str] = typer.Argument(None, help="Name of the task to run"),
+        list_tasks: bool = typer.Option(
+            False,
+            "--list",
+            "-l",
+            help="List the tasks defined in config",
+        ),
+    ) -> None:
+        """Run a custom task defined in config.
+
+        Without a task name, lists the available tasks.
+        """
+        # Imported here so other commands never load the task executor
+        from devflow.commands.task_command import create_task_typer_command
+
+        create_task_typer_command(get_context())(task_name=name, list_tasks=list_tasks)
+
+
+def _register_completion(app: "typer.Typer") -> None:
+    """Workstream G: Completion command."""
+    import typer
+
+    @app.command()
+    def completion(
+        shell: str = typer.Argument(
+            ...,
+            help="Shell to generate completion for (bash, zsh, fish)",
+        ),
+    ) -> None:
+        """Generate shell completion script.
+
+        Enable completion in the current shell with, for example:
+        eval "$(devflow completion zsh)"
+        """
+        # Completion machinery is only imported when a script is requested
+        from typer.completion import get_completion_script
+
+        typer.echo(
+            get_completion_script(prog_name="devflow", complete_var=_COMPLETE_VAR, shell=shell)
+        )
 
-# Workstream C: Deps commands
-deps_app = typer.Typer(help="Manage dependencies")
-app.add_typer(deps_app, name="deps")
 
+# Environment variable the generated completion scripts set when calling
+# back into devflow; Click derives the same name from the program name
+_COMPLETE_VAR = "_DEVFLOW_COMPLETE"
 
-@deps_app.command("sync")
-def deps_sync() -> None:
-    """Synchronize dependencies from requirements.
+# Maps each top-level command name to the function that registers it
+_COMMAND_TABLE: "dict[str, Callable[[typer.Typer], None]]" = {
+    "venv": _register_venv,
+    "deps": _register_deps,
+    "test": _register_test,
+    "build": _register_build,
+    "publish": _register_publish,
+    "git": _register_git,
+    "version": _register_version,
+    "task": _register_task,
+    "completion": _register_completion,
+}
 
-    Implementation owned by Workstream C.
-    """
-    ctx = get_context()
-    ctx.log("deps sync: Not yet implemented (Workstream C)", phase="deps")
+# Global options that consume the following argv token as their value
+_GLOBAL_OPTIONS_WITH_VALUE = frozenset({"--config", "-c", "--project-root", "-p"})
 
 
-@deps_app.command("freeze")
-def deps_freeze() -> None:
-    """Freeze installed packages to requirements file.
+def _sniff_subcommand(argv: list[str]) -> "Optional[str]":
+    """Detect the subcommand being invoked without building the parser.
 
-    Implementation owned by Workstream C.
-    """
-    ctx = get_context()
-    ctx.log("deps freeze: Not yet implemented (Workstream C)", phase="deps")
-
-
-# Workstream D: Test command
-@app.command()
-def test(
-    pattern: str | None = typer.Option(
-        None,
-        "--pattern",
-        "-k",
-        help="Test name pattern to match",
-    ),
-    marker: str | None = typer.Option(
-        None,
-        "--marker",
-        "-m",
-        help="Only run tests with given marker",
-    ),
-    cov: bool = typer.Option(
-        False,
-        "--cov",
-        help="Run with coverage",
-    ),
-) -> None:
-    """Run tests.
-
-    Implementation owned by Workstream D.
-    """
-    ctx = get_context()
-    ctx.log("test: Not yet implemented (Workstream D)", phase="test")
+    Walks the arguments, skipping global flags (and the values of options
+    such as ``--config PATH``) until the first positional token is found.
 
+    Args:
+        argv: Command-line arguments, excluding the program name.
 
-# Workstream D: Build command
-@app.command()
-def build() -> None:
-    """Build distribution artifacts.
-
-    Implementation owned by Workstream D.
+    Returns:
+        The subcommand name if it is a known command, None otherwise
+        (e.g. bare ``--help``, no arguments, or an unknown command).
     """
-    ctx = get_context()
-    ctx.log("build: Not yet implemented (Workstream D)", phase="build")
-
-
-# Workstream D: Publish command
-@app.command()
-def publish(
-    repository: str | None = typer.Option(
-        None,
-        "--repository",
-        "-r",
-        help="Target repository (pypi, testpypi, or custom)",
-    ),
-    skip_tests: bool = typer.Option(
-        False,
-        "--skip-tests",
-        help="Skip running tests before publish",
-    ),
-    allow_dirty: bool = typer.Option(
-        False,
-        "--allow-dirty",
-        help="Allow publishing with uncommitted changes",
-    ),
-) -> None:
-    """Build and upload to package index.
-
-    Implementation owned by Workstream D.
+    args = iter(argv)
+    for arg in args:
+        if arg in _GLOBAL_OPTIONS_WITH_VALUE:
+            next(args, None)
+            continue
+        if arg == "--":
+            arg = next(args, "")
+        elif arg.startswith("-"):
+            continue
+        return arg if arg in _COMMAND_TABLE else None
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_app(command: "Optional[str]" = None) -> "typer.Typer":
+    """Build the Typer application.
+
+    Typer is imported here rather than at module level, and the result is
+    cached per ``command`` so each variant is only constructed once.
+
+    Args:
+        command: If given, only this subcommand is registered. If None,
+            every command is registered (needed for help and discovery).
+
+    Returns:
+        The configured Typer application.
     """
-    ctx = get_context()
-    ctx.log("publish: Not yet implemented (Workstream D)", phase="publish")
-
+    import typer
 
-# Workstream E: Git commands
-git_app = typer.Typer(help="Git-related helper commands")
-app.add_typer(git_app, name="git")
+    # Create the main Typer app
+    app = typer.Typer(
+        name="devflow",
+        help="A Python-Native Project Operations CLI",
+        no_args_is_help=False,
+        add_completion=False,
+    )
+    _register_main(app)
 
+    for name, register in _COMMAND_TABLE.items():
+        if command is None or name == command:
+            register(app)
 
-@git_app.command("status")
-def git_status() -> None:
-    """Show git status relevant to devflow.
-
-    Implementation owned by Workstream E.
-    """
-    ctx = get_context()
-    ctx.log("git status: Not yet implemented (Workstream E)", phase="git")
+    return app
 
 
-# Workstream E: Version command
-@app.command("version")
-def show_version() -> None:
-    """Show project version.
+def __getattr__(name: str) -> "Any":
+    """Lazily build module attributes (PEP 562).
 
-    Implementation owned by Workstream E.
+    ``app`` is constructed on first access so that importing this module
+    does not import Typer.
     """
-    ctx = get_context()
-    ctx.log("version: Not yet implemented (Workstream E)", phase="version")
+    if name == "app":
+        return _get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-# Workstream B: Task command
-@app.command()
-def task(
-    name: str = typer.Argument(..., help="Name of the task to run"),
-) -> None:
-    """Run a custom task defined in config.
-
-    Implementation owned by Workstream B.
-    """
-    ctx = get_context()
-    ctx.log(f"task {name}: Not yet implemented (Workstream B)", phase="task")
-
-
-# Workstream G: Completion command
-@app.command()
-def completion(
-    shell: str = typer.Argument(
-        ...,
-        help="Shell to generate completion for (bash, zsh, fish)",
-    ),
-) -> None:
-    """Generate shell completion script.
+def cli() -> None:
+    """Entry point for the devflow CLI.
 
-    Implementation owned by Workstream G.
+    Only the subcommand named on the command line is registered with Typer,
+    so the parsers for the other commands are never built. A bare
+    ``devflow --version`` (or ``-V``) is answered before Typer is imported.
     """
-    ctx = get_context()
-    ctx.log(f"completion {shell}: Not yet implemented (Workstream G)", phase="completion")
-
-
-def cli() -> None:
-    """Entry point for the devflow CLI."""
-    app()
+    argv = sys.argv[1:]
+    if argv in (["--version"], ["-V"]):
+        sys.stdout.write(_version_text() + "\n")
+        return
+    if _COMPLETE_VAR in os.environ:
+        # The app is built without Typer's completion options, so register
+        # the completion classes only when a shell asks for completions
+        from typer.completion import completion_init
+
+        completion_init()
+    _get_app(_sniff_subcommand(argv))()
 
 
 if __name__ == "__main__":
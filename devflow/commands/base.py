@@ -9,8 +9,9 @@ Ownership: Workstream B (task/registry)
 
 from __future__ import annotations
 
+import bisect
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
 
 if TYPE_CHECKING:
     # AppContext is owned by Workstream A - we only type hint it
@@ -75,6 +76,19 @@ class Command(ABC):
         ...
 
 
+class LazyCommand(NamedTuple):
+    """Placeholder for a registered command whose module is not yet imported.
+
+    Attributes:
+        help: Short help text, available without importing the command.
+        loader: Zero-argument callable that imports and returns the
+            Command subclass.
+    """
+
+    help: str
+    loader: Callable[[], type[Command]]
+
+
 class CommandRegistry:
     """Registry for mapping command names to handler classes.
 
@@ -82,6 +96,13 @@ class CommandRegistry:
     corresponding Command subclasses. It supports registration of built-in
     commands, plugin commands, and config-defined custom tasks.
 
+    Commands can also be registered lazily by name, help text and a loader,
+    so that listing commands does not import their modules; the loader runs
+    on the first ``get()``.
+
+    Once every command is registered, ``freeze()`` makes the registry
+    read-only, after which ``names`` is a shared tuple rather than a copy.
+
     Example:
         >>> registry = CommandRegistry()
         >>> registry.register(TestCommand)
@@ -92,7 +113,11 @@ class CommandRegistry:
 
     def __init__(self) -> None:
         """Initialize an empty command registry."""
-        self._commands: dict[str, type[Command]] = {}
+        self._commands: dict[str, type[Command] | LazyCommand] = {}
+        # Command names kept in sorted order as commands are (un)registered
+        self._sorted_names: list[str] = []
+        # Snapshot of the sorted names, set by freeze()
+        self._frozen_names: tuple[str, ...] | None = None
 
     def register(self, cmd_cls: type[Command]) -> None:
         """Register a command class.
@@ -102,13 +127,39 @@ class CommandRegistry:
 
         Raises:
             ValueError: If a command with the same name is already registered.
+            RuntimeError: If the registry has been frozen.
+        """
+        self._add(cmd_cls.name, cmd_cls)
+
+    def register_lazy(
+        self, name: str, help: str, loader: Callable[[], type[Command]]
+    ) -> None:
+        """Register a command without importing its module.
+
+        Args:
+            name: The command name.
+            help: Short help text for the command.
+            loader: Zero-argument callable returning the Command subclass.
+                It is called once, on the first ``get()`` for this name.
+
+        Raises:
+            ValueError: If a command with the same name is already registered.
+            RuntimeError: If the registry has been frozen.
         """
-        if cmd_cls.name in self._commands:
+        self._add(name, LazyCommand(help, loader))
+
+    def _add(self, name: str, entry: type[Command] | LazyCommand) -> None:
+        """Insert a registry entry, rejecting duplicate names."""
+        self._check_not_frozen()
+        # Single hash probe: setdefault only inserts when the name is new
+        count = len(self._commands)
+        self._commands.setdefault(name, entry)
+        if len(self._commands) == count:
             raise ValueError(
-                f"Command '{cmd_cls.name}' is already registered. "
+                f"Command '{name}' is already registered. "
                 "Use a different name or unregister the existing command first."
             )
-        self._commands[cmd_cls.name] = cmd_cls
+        bisect.insort(self._sorted_names, name)
 
     def unregister(self, name: str) -> bool:
         """Unregister a command by name.
@@ -118,9 +169,14 @@ class CommandRegistry:
 
         Returns:
             True if the command was unregistered, False if not found.
+
+        Raises:
+            RuntimeError: If the registry has been frozen.
         """
+        self._check_not_frozen()
         if name in self._commands:
             del self._commands[name]
+            del self._sorted_names[bisect.bisect_left(self._sorted_names, name)]
             return True
         return False
 
@@ -133,7 +189,46 @@ class CommandRegistry:
         Returns:
             The Command subclass if found, None otherwise.
         """
-        return self._commands.get(name)
+        entry = self._commands.get(name)
+        if isinstance(entry, LazyCommand):
+            entry = self._commands[name] = entry.loader()
+        return entry
+
+    def get_help(self, name: str) -> str | None:
+        """Get a command's help text without importing lazy commands.
+
+        Args:
+            name: The name of the command.
+
+        Returns:
+            The help text if the command is registered, None otherwise.
+        """
+        entry = self._commands.get(name)
+        return entry.help if entry is not None else None
+
+    def freeze(self) -> None:
+        """Make the registry read-only.
+
+        Further calls to ``register``, ``register_lazy`` or ``unregister``
+        raise RuntimeError. Lazy entries are still loaded on first ``get()``.
+        """
+        self._frozen_names = tuple(self._sorted_names)
+
+    def _check_not_frozen(self) -> None:
+        """Raise if the registry has been frozen."""
+        if self._frozen_names is not None:
+            raise RuntimeError("Command registry is frozen and can no longer be modified.")
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Sorted registered command names.
+
+        Once the registry is frozen this returns the same tuple every time
+        without copying.
+        """
+        if self._frozen_names is not None:
+            return self._frozen_names
+        return tuple(self._sorted_names)
 
     def list_commands(self) -> list[str]:
         """List all registered command names.
@@ -141,7 +236,7 @@ class CommandRegistry:
         Returns:
             Sorted list of registered command names.
         """
-        return sorted(self._commands.keys())
+        return list(self._sorted_names)
 
     def __contains__(self, name: str) -> bool:
         """Check if a command is registered.
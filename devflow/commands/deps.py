@@ -6,23 +6,49 @@ It implements `devflow deps sync` and `devflow deps freeze` commands.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import shutil
 import subprocess
+from importlib import metadata
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from devflow._version import __version__
+from devflow.core.cache import atomic_write_bytes
 from devflow.core.paths import (
     build_venv_command,
     get_venv_dir,
     get_venv_pip,
     get_venv_python,
+    get_venv_site_packages,
     has_pyproject_dependencies,
     resolve_requirements_files,
     venv_exists,
+    venv_includes_system_site_packages,
 )
 
 if TYPE_CHECKING:
     from typing import Optional
 
+    from devflow.config.schema import DevflowConfig
+
+
+# Installer packages left out of freeze output unless include_all is set,
+# matched against case-folded requirement lines
+_INSTALLER_PREFIXES = ("pip==", "setuptools==", "wheel==")
+
+# File inside the venv recording the inputs of the last successful sync
+_SYNC_STAMP = ".devflow-sync"
+
+# Message prefixes for each _log() level, looked up instead of branching
+_LOG_PREFIXES = {
+    "info": "[deps]",
+    "error": "[deps] ERROR:",
+    "debug": "[deps] DEBUG:",
+}
+
 
 class DepsManager:
     """Manages dependency installation and freezing.
@@ -39,6 +65,10 @@ class DepsManager:
         verbose: Whether to enable verbose output.
         dry_run: Whether to perform a dry run.
         quiet: Whether to suppress output.
+        batch_installs: Whether sync installs every source in one pip run.
+        skip_unchanged: Whether sync skips pip when nothing changed since
+            the last successful sync.
+        installer: Package installer to run, "pip" or "uv".
     """
 
     def __init__(
@@ -51,6 +81,9 @@ class DepsManager:
         verbose: bool = False,
         dry_run: bool = False,
         quiet: bool = False,
+        batch_installs: bool = True,
+        skip_unchanged: bool = True,
+        installer: str = "pip",
     ):
         """Initialize the DepsManager.
 
@@ -63,6 +96,15 @@ class DepsManager:
             verbose: Enable verbose output.
             dry_run: Perform dry run without making changes.
             quiet: Suppress non-error output.
+            batch_installs: Install pyproject.toml and all requirements files
+                with a single pip invocation. Set to False to run pip once
+                per source, which pinpoints the failing file.
+            skip_unchanged: Skip pip in sync when the requirements files,
+                pyproject.toml and the venv's site-packages are unchanged
+                since the last successful sync. ``upgrade`` always runs pip.
+            installer: "uv" runs ``uv pip`` against the venv's Python when
+                uv is on PATH, falling back to pip otherwise. Any other
+                value uses the venv's pip.
         """
         self.project_root = Path(project_root).resolve()
         self.venv_dir_name = venv_dir_name
@@ -72,11 +114,47 @@ class DepsManager:
         self.verbose = verbose
         self.dry_run = dry_run
         self.quiet = quiet
+        self.batch_installs = batch_installs
+        self.skip_unchanged = skip_unchanged
+        self.installer = installer
+        self._venv_dir_cache: Optional[tuple[tuple[Path, str], Path]] = None
+        self._venv_python_cache: Optional[tuple[Path, Path]] = None
+        self._pyproject_deps_cache: Optional[tuple[Path, bool]] = None
 
     @property
     def venv_dir(self) -> Path:
-        """Get the full path to the venv directory."""
-        return get_venv_dir(self.project_root, self.venv_dir_name)
+        """Get the full path to the venv directory.
+
+        The resolved path is cached and only recomputed when
+        ``project_root`` or ``venv_dir_name`` change.
+        """
+        key = (self.project_root, self.venv_dir_name)
+        if self._venv_dir_cache is None or self._venv_dir_cache[0] != key:
+            self._venv_dir_cache = (key, get_venv_dir(*key))
+        return self._venv_dir_cache[1]
+
+    @property
+    def venv_python(self) -> Path:
+        """Get the path to the venv's Python executable.
+
+        Cached alongside ``venv_dir`` and recomputed only when it changes.
+        """
+        venv_dir = self.venv_dir
+        if self._venv_python_cache is None or self._venv_python_cache[0] != venv_dir:
+            self._venv_python_cache = (venv_dir, get_venv_python(venv_dir))
+        return self._venv_python_cache[1]
+
+    @property
+    def has_pyproject_deps(self) -> bool:
+        """Whether pyproject.toml declares dependencies.
+
+        The file is parsed once and the answer cached until
+        ``project_root`` changes.
+        """
+        root = self.project_root
+        if self._pyproject_deps_cache is None or self._pyproject_deps_cache[0] != root:
+            self._pyproject_deps_cache = (root, has_pyproject_dependencies(root))
+        return self._pyproject_deps_cache[1]
 
     def _log(self, message: str, level: str = "info") -> None:
         """Log a message with the appropriate prefix.
@@ -91,13 +169,7 @@ class DepsManager:
         if level == "debug" and not self.verbose:
             return
 
-        prefix = "[deps]"
-        if level == "error":
-            prefix = "[deps] ERROR:"
-        elif level == "debug":
-            prefix = "[deps] DEBUG:"
-
-        print(f"{prefix} {message}")
+        print(f"{_LOG_PREFIXES.get(level, '[deps]')} {message}")
 
     def _ensure_venv(self) -> bool:
         """Ensure the virtual environment exists.
@@ -118,20 +190,41 @@ class DepsManager:
         self,
         args: list[str],
         check: bool = True,
+        stream_stdout: bool = False,
     ) -> subprocess.CompletedProcess:
         """Run pip command in the venv.
 
+        With ``installer="uv"`` the command runs as ``uv pip`` targeting the
+        venv's Python, when uv is on PATH.
+
+        pip's output goes straight to the terminal in verbose mode. Otherwise
+        stdout is discarded (or passed through with ``stream_stdout``) and
+        only stderr is captured, for error reporting; nothing else is
+        buffered in memory.
+
         Args:
             args: Arguments to pass to pip.
             check: Whether to check for non-zero exit code.
+            stream_stdout: Pass pip's stdout through to the terminal even
+                when not verbose (for commands whose output is the result).
 
         Returns:
-            CompletedProcess instance.
+            CompletedProcess instance. ``stderr`` is set when not verbose;
+            ``stdout`` is always None.
         """
-        venv_python = get_venv_python(self.venv_dir)
-        cmd = [str(venv_python), "-m", "pip"] + args
+        uv = shutil.which("uv") if self.installer == "uv" else None
+        if uv is None and self.installer == "uv":
+            self._log("uv not found on PATH, using pip", level="debug")
+
+        # Built in one step rather than concatenating a prefix list with args
+        if uv:
+            cmd = [uv, "pip", *args, "--python", str(self.venv_python)]
+        else:
+            cmd = [str(self.venv_python), "-m", "pip", *args]
 
-        self._log(f"Running: {' '.join(cmd)}", level="debug")
+        # Debug messages are dropped unless verbose; skip the join then
+        if self.verbose:
+            self._log(f"Running: {' '.join(cmd)}", level="debug")
 
         if self.dry_run:
             self._log(f"DRY RUN: Would run: {' '.join(cmd)}")
@@ -143,10 +236,20 @@ class DepsManager:
                 stderr="",
             )
 
+        if self.verbose:
+            stdout, stderr = None, None
+        else:
+            stdout = None if stream_stdout else subprocess.DEVNULL
+            stderr = subprocess.PIPE
+
+        # close_fds=False (our fds are non-inheritable anyway) together with
+        # no cwd/env overrides lets CPython spawn pip via posix_spawn
         result = subprocess.run(
             cmd,
-            capture_output=not self.verbose,
+            stdout=stdout,
+            stderr=stderr,
             text=True,
+            close_fds=False,
         )
 
         return result
@@ -184,62 +287,121 @@ class DepsManager:
         )
 
         # Check for pyproject.toml dependencies
-        has_pyproject_deps = has_pyproject_dependencies(self.project_root)
+        has_pyproject_deps = self.has_pyproject_deps
 
         if not req_files and not has_pyproject_deps:
             self._log("No requirements files or pyproject.toml dependencies found")
             return 0
 
-        exit_code = 0
-
-        # Install from pyproject.toml if it has dependencies
+        # Each install source as (label, pip arguments)
+        sources: list[tuple[str, list[str]]] = []
         if has_pyproject_deps:
-            self._log(f"Installing from pyproject.toml")
-
-            install_args = ["install", "-e", str(self.project_root)]
-
-            if upgrade:
-                install_args.append("--upgrade")
-
             # Handle extras (stub - can be extended later)
+            target = str(self.project_root)
             if extras:
-                extras_str = ",".join(extras)
-                install_args[-1] = f"{self.project_root}[{extras_str}]"
-
-            result = self._run_pip(install_args)
-            if result.returncode != 0:
-                self._log(
-                    f"Failed to install from pyproject.toml: {result.stderr}",
-                    level="error",
-                )
-                exit_code = result.returncode
+                target = f"{target}[{','.join(extras)}]"
+            sources.append(("pyproject.toml", ["-e", target]))
+        sources.extend((req_file.name, ["-r", str(req_file)]) for req_file in req_files)
+
+        # Nothing to do if the inputs match those of the last successful sync
+        signature = None if upgrade else self._sync_signature(sources)
+        if signature is not None and signature == self._read_sync_stamp():
+            self._log("Dependencies already up to date")
+            return 0
 
-        # Install from requirements files
-        for req_file in req_files:
-            self._log(f"Installing from {req_file.name}")
+        # One pip run lets the resolver see every requirement at once and
+        # avoids an interpreter start per file
+        groups = [sources] if self.batch_installs else [[source] for source in sources]
 
-            install_args = ["install", "-r", str(req_file)]
+        exit_code = 0
+        for group in groups:
+            names = ", ".join(label for label, _ in group)
+            self._log(f"Installing from {names}")
 
+            install_args = ["install"]
+            for _, args in group:
+                install_args.extend(args)
             if upgrade:
                 install_args.append("--upgrade")
 
             result = self._run_pip(install_args)
             if result.returncode != 0:
-                self._log(
-                    f"Failed to install from {req_file.name}: {result.stderr}",
-                    level="error",
-                )
+                self._log(f"Failed to install from {names}: {result.stderr}", level="error")
                 exit_code = result.returncode
 
         if exit_code == 0:
             self._log("Dependencies synced successfully")
+            if signature is not None and not self.dry_run:
+                # Recomputed, since installing changes site-packages
+                self._write_sync_stamp(self._sync_signature(sources))
 
         return exit_code
 
+    def _sync_signature(self, sources: list[tuple[str, list[str]]]) -> Optional[str]:
+        """Summarize everything a sync of ``sources`` depends on.
+
+        Covers the devflow version, the pip arguments, the contents of
+        pyproject.toml and each requirements file, and the mtime of the
+        venv's site-packages, which changes whenever a distribution is
+        installed or removed. Hashing file contents rather than their
+        mtimes keeps the signature stable across fresh checkouts, such as
+        a CI job restoring a cached venv. Files pulled in with ``-r`` from
+        inside a requirements file are not tracked.
+
+        Args:
+            sources: Install sources as (label, pip arguments).
+
+        Returns:
+            A hex digest, or None if skipping is disabled or site-packages
+            cannot be found.
+        """
+        if not self.skip_unchanged:
+            return None
+        site_packages = get_venv_site_packages(self.venv_dir)
+        if site_packages is None:
+            return None
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((__version__, str(self.venv_python), sources)).encode())
+
+        files = [self.project_root / "pyproject.toml"]
+        files.extend(Path(args[1]) for _, args in sources if args[0] == "-r")
+        for path in files:
+            try:
+                content = path.read_bytes()
+            except OSError:
+                content = b""
+            digest.update(f"\0{path}\0{len(content)}\0".encode())
+            digest.update(content)
+
+        try:
+            site_packages_mtime: Optional[int] = os.stat(site_packages).st_mtime_ns
+        except OSError:
+            site_packages_mtime = None
+        digest.update(repr((str(site_packages), site_packages_mtime)).encode())
+        return digest.hexdigest()
+
+    def _read_sync_stamp(self) -> Optional[str]:
+        """Read the signature stored by the last successful sync, if any."""
+        try:
+            return (self.venv_dir / _SYNC_STAMP).read_text().strip()
+        except OSError:
+            return None
+
+    def _write_sync_stamp(self, signature: Optional[str]) -> None:
+        """Store a sync signature in the venv, ignoring failures."""
+        if signature is None:
+            return
+        try:
+            atomic_write_bytes(self.venv_dir / _SYNC_STAMP, signature.encode())
+        except OSError:
+            pass
+
     def freeze(
         self,
         output_path: Optional[str] = None,
         include_all: bool = False,
+        legacy: bool = False,
     ) -> int:
         """Freeze installed packages to a file.
 
@@ -249,6 +411,8 @@ class DepsManager:
         Args:
             output_path: Override output path from config.
             include_all: Include all packages (including pip, setuptools, etc.).
+            legacy: List packages with ``pip freeze`` instead of reading the
+                venv's installed distribution metadata directly.
 
         Returns:
             Exit code (0 for success, non-zero for failure).
@@ -260,38 +424,40 @@ class DepsManager:
 
         self._log(f"Freezing dependencies to {output_file}")
 
-        # Get the list of installed packages
-        freeze_args = ["freeze"]
-
-        # Run pip freeze to get package list
-        venv_python = get_venv_python(self.venv_dir)
-        cmd = [str(venv_python), "-m", "pip"] + freeze_args
+        # Read installed distributions in-process; fall back to pip when the
+        # venv layout is not one we can enumerate on our own
+        packages = None if legacy else self._installed_packages()
 
-        self._log(f"Running: {' '.join(cmd)}", level="debug")
+        if packages is None:
+            cmd = [str(self.venv_python), "-m", "pip", "freeze"]
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-        )
+            self._log(f"Running: {' '.join(cmd)}", level="debug")
 
-        if result.returncode != 0:
-            self._log(f"Failed to freeze dependencies: {result.stderr}", level="error")
-            return result.returncode
-
-        # Parse and sort the output for deterministic ordering
-        packages = result.stdout.strip().split("\n") if result.stdout.strip() else []
-
-        # Filter out common installer packages unless include_all
-        if not include_all:
-            excluded_prefixes = ("pip==", "setuptools==", "wheel==")
-            packages = [
-                p for p in packages
-                if p and not p.lower().startswith(excluded_prefixes)
-            ]
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                close_fds=False,
+            )
 
-        # Sort packages case-insensitively for deterministic output
-        packages.sort(key=str.lower)
+            if result.returncode != 0:
+                self._log(f"Failed to freeze dependencies: {result.stderr}", level="error")
+                return result.returncode
+
+            # Parse the output; blank lines are dropped and the rest sorted
+            # below for deterministic ordering
+            packages = result.stdout.splitlines()
+
+        # Case-fold each line once, for both the installer filter (skipped
+        # with include_all) and the case-insensitive sort that keeps the
+        # output deterministic
+        excluded_prefixes = () if include_all else _INSTALLER_PREFIXES
+        keyed = sorted(
+            (folded, p)
+            for folded, p in ((p.casefold(), p) for p in map(str.strip, packages) if p)
+            if not folded.startswith(excluded_prefixes)
+        )
+        packages = [p for _, p in keyed]
 
         # Create the output content with header
         header = [
@@ -308,8 +474,22 @@ class DepsManager:
             print("=" * 60)
             return 0
 
+        # Written as bytes: no newline translation, so the file is
+        # identical on every platform
+        data = content.encode("utf-8")
+
+        # Leave an identical file untouched so its mtime, and any caches
+        # keyed on it, survive
+        try:
+            unchanged = output_file.read_bytes() == data
+        except OSError:
+            unchanged = False
+        if unchanged:
+            self._log(f"{output_file} is already up to date")
+            return 0
+
         try:
-            output_file.write_text(content)
+            atomic_write_bytes(output_file, data)
             self._log(f"Dependencies frozen to {output_file}")
             self._log(f"Total packages: {len(packages)}", level="debug")
             return 0
@@ -317,6 +497,34 @@ class DepsManager:
             self._log(f"Failed to write freeze file: {e}", level="error")
             return 1
 
+    def _installed_packages(self) -> Optional[list[str]]:
+        """List the venv's installed distributions in ``pip freeze`` format.
+
+        Reads distribution metadata from the venv's site-packages instead of
+        starting pip. Editable and direct-URL installs are written as
+        ``-e <url>`` and ``<name> @ <url>``, as pip does.
+
+        Returns:
+            Unsorted requirement lines, or None if the packages cannot be
+            enumerated this way (site-packages not found, or the venv also
+            sees the system site-packages).
+        """
+        if venv_includes_system_site_packages(self.venv_dir):
+            return None
+        site_packages = get_venv_site_packages(self.venv_dir)
+        if site_packages is None:
+            return None
+
+        self._log(f"Reading installed packages from {site_packages}", level="debug")
+
+        lines: dict[str, str] = {}
+        for dist in metadata.distributions(path=[str(site_packages)]):
+            name = dist.metadata["Name"]
+            # Like pip, keep the first distribution found for a name
+            if name and name.lower() not in lines:
+                lines[name.lower()] = _freeze_line(name, dist)
+        return list(lines.values())
+
     def list(self, outdated: bool = False) -> int:
         """List installed packages.
 
@@ -336,17 +544,44 @@ class DepsManager:
             self._log("Listing installed packages")
             args = ["list", "--format=columns"]
 
-        result = self._run_pip(args)
+        # The listing is the command's output, so pip writes it directly
+        result = self._run_pip(args, stream_stdout=True)
 
         if not self.dry_run:
-            if result.stdout:
-                print(result.stdout)
             if result.returncode != 0 and result.stderr:
                 self._log(result.stderr, level="error")
 
         return result.returncode
 
 
+def _freeze_line(name: str, dist: metadata.Distribution) -> str:
+    """Format an installed distribution as a ``pip freeze`` line.
+
+    Args:
+        name: The distribution's project name.
+        dist: The installed distribution.
+
+    Returns:
+        ``name==version``, or a ``-e``/``@`` line for editable and direct-URL
+        installs (PEP 610).
+    """
+    direct_url = dist.read_text("direct_url.json")
+    if direct_url:
+        try:
+            info = json.loads(direct_url)
+        except ValueError:
+            info = {}
+        url = info.get("url")
+        if url:
+            if info.get("dir_info", {}).get("editable"):
+                return f"-e {url}"
+            vcs_info = info.get("vcs_info")
+            if vcs_info:
+                url = f"{vcs_info['vcs']}+{url}@{vcs_info['commit_id']}"
+            return f"{name} @ {url}"
+    return f"{name}=={dist.version}"
+
+
 def create_deps_manager(
     project_root: Optional[Path] = None,
     venv_dir: str = ".venv",
@@ -356,6 +591,7 @@ def create_deps_manager(
     verbose: bool = False,
     dry_run: bool = False,
     quiet: bool = False,
+    installer: str = "pip",
 ) -> DepsManager:
     """Factory function to create a DepsManager.
 
@@ -371,6 +607,7 @@ def create_deps_manager(
         verbose: Enable verbose output.
         dry_run: Perform dry run.
         quiet: Suppress output.
+        installer: Package installer to run, "pip" or "uv".
 
     Returns:
         Configured DepsManager instance.
@@ -392,4 +629,41 @@ def create_deps_manager(
         verbose=verbose,
         dry_run=dry_run,
         quiet=quiet,
+        installer=installer,
+    )
+
+
+def create_deps_manager_from_config(
+    config: DevflowConfig,
+    project_root: Optional[Path] = None,
+    verbose: bool = False,
+    dry_run: bool = False,
+    quiet: bool = False,
+) -> DepsManager:
+    """Create a DepsManager from a loaded devflow configuration.
+
+    Takes the venv directory and the ``[tool.devflow.deps]`` settings,
+    including the installer, from the config.
+
+    Args:
+        config: The loaded devflow configuration.
+        project_root: Project root path. If None, will attempt to find it.
+        verbose: Enable verbose output.
+        dry_run: Perform dry run.
+        quiet: Suppress output.
+
+    Returns:
+        Configured DepsManager instance.
+    """
+    deps = config.deps
+    return create_deps_manager(
+        project_root=project_root,
+        venv_dir=config.venv_dir,
+        requirements=deps.requirements,
+        dev_requirements=deps.dev_requirements,
+        freeze_output=deps.freeze_output,
+        verbose=verbose,
+        dry_run=dry_run,
+        quiet=quiet,
+        installer=deps.installer,
     )
@@ -10,13 +10,16 @@ Ownership: Workstream B (task/registry)
 from __future__ import annotations
 
 import os
+import shlex
+import shutil
 import subprocess
 import sys
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Collection
 
-from devflow.commands.task import Pipeline, Task, TaskDefinition, is_pipeline
+from devflow.commands.task import Pipeline, Task, TaskDefinition
 
 if TYPE_CHECKING:
     from typing import Protocol
@@ -29,6 +32,9 @@ if TYPE_CHECKING:
         dry_run: bool
         verbosity: int
 
+# Most lines of captured stderr kept on an ExecutionResult
+MAX_OUTPUT_LINES = 1000
+
 
 @dataclass
 class ExecutionResult:
@@ -37,7 +43,8 @@ class ExecutionResult:
     Attributes:
         task_name: Name of the task that was executed.
         exit_code: Exit code from the task (0 = success).
-        output: Captured stdout/stderr if available.
+        output: Captured stderr (only at normal verbosity), trimmed to the
+            last ``MAX_OUTPUT_LINES`` lines.
         skipped: Whether the task was skipped (dry-run mode).
         error: Error message if the task failed to start.
     """
@@ -55,7 +62,8 @@ class PipelineResult:
 
     Attributes:
         pipeline_name: Name of the pipeline.
-        results: List of ExecutionResults for each task in the pipeline.
+        results: List of ExecutionResults for each task (or fused group of
+            steps) in the pipeline.
         short_circuited: Whether the pipeline was short-circuited due to failure.
     """
 
@@ -98,19 +106,28 @@ class CycleDetectedError(Exception):
 class TaskNotFoundError(Exception):
     """Raised when a referenced task is not found."""
 
-    def __init__(self, task_name: str, available_tasks: list[str] | None = None) -> None:
+    def __init__(self, task_name: str, available_tasks: Collection[str] | None = None) -> None:
         """Initialize with the missing task name.
 
         Args:
             task_name: Name of the task that was not found.
-            available_tasks: List of available task names for the error message.
+            available_tasks: Available task names for the error message. Only
+                copied and sorted when read or when the message is formatted.
         """
         self.task_name = task_name
-        self.available_tasks = available_tasks or []
-        msg = f"Task '{task_name}' not found"
-        if self.available_tasks:
-            msg += f". Available tasks: {', '.join(sorted(self.available_tasks))}"
-        super().__init__(msg)
+        self._available_tasks = available_tasks or ()
+        super().__init__(task_name)
+
+    @property
+    def available_tasks(self) -> list[str]:
+        """Sorted names of the available tasks."""
+        return sorted(self._available_tasks)
+
+    def __str__(self) -> str:
+        msg = f"Task '{self.task_name}' not found"
+        if self._available_tasks:
+            msg += f". Available tasks: {', '.join(self.available_tasks)}"
+        return msg
 
 
 # Type for the logging callback function
@@ -133,6 +150,7 @@ class TaskExecutor:
         dry_run: Whether to run in dry-run mode.
         verbosity: Logging verbosity level (-1=quiet, 0=normal, 1+=verbose).
         log_callback: Optional callback for custom logging.
+        fuse_steps: Whether to run runs of compatible pipeline steps in one shell.
     """
 
     def __init__(
@@ -143,6 +161,7 @@ class TaskExecutor:
         verbosity: int = 0,
         log_callback: LogCallback | None = None,
         venv_path: Path | None = None,
+        fuse_steps: bool = False,
     ) -> None:
         """Initialize the task executor.
 
@@ -153,6 +172,8 @@ class TaskExecutor:
             verbosity: Logging verbosity (-1=quiet, 0=normal, 1+=verbose).
             log_callback: Optional callback for custom logging (phase, message, level).
             venv_path: Path to the virtual environment (for use_venv tasks).
+            fuse_steps: Run consecutive pipeline steps that share env and
+                working_dir as a single ``/bin/sh -c "a && b"`` process.
         """
         self.task_definitions = task_definitions
         self.project_root = project_root or Path.cwd()
@@ -160,6 +181,15 @@ class TaskExecutor:
         self.verbosity = verbosity
         self.log_callback = log_callback
         self.venv_path = venv_path
+        self.fuse_steps = fuse_steps
+        # Bare command names resolved against PATH, reused across tasks
+        self._which_cache: dict[str, str] = {}
+        # Expanded pipelines by name; task definitions are fixed once set
+        self._expand_cache: dict[str, list[Task]] = {}
+        # Venv lookups of task commands, keyed by venv path and command
+        self._venv_exec_cache: dict[tuple[Path, str], str] = {}
+        # Merged environments keyed by their overrides, shared by pipeline steps
+        self._env_cache: dict[frozenset[tuple[str, str]], dict[str, str]] = {}
 
     def _log(self, phase: str, message: str, level: int = 0) -> None:
         """Log a message with a phase prefix.
@@ -178,22 +208,29 @@ class TaskExecutor:
         if self.log_callback:
             self.log_callback(phase, message, level)
         else:
-            # Default logging to stderr
-            prefix = f"[{phase}]" if phase else ""
-            print(f"{prefix} {message}", file=sys.stderr)
+            # Default logging to stderr, as one write so that lines from
+            # parallel steps do not interleave with each other's newlines
+            sys.stderr.write(f"[{phase}] {message}\n" if phase else f" {message}\n")
 
     def expand_pipeline(
-        self, name: str, visited: set[str] | None = None, path: list[str] | None = None
+        self,
+        name: str,
+        visited: set[str] | None = None,
+        path: list[str] | None = None,
+        on_path: set[str] | None = None,
     ) -> list[Task]:
         """Recursively expand a pipeline into a flat list of tasks.
 
         This method handles nested pipelines and detects cycles to prevent
-        infinite recursion.
+        infinite recursion. Each pipeline is expanded once per executor;
+        later calls, including for pipelines nested in others, reuse it.
 
         Args:
             name: Name of the task/pipeline to expand.
             visited: Set of task names that have been fully processed.
             path: Current path in the expansion (for cycle detection).
+            on_path: The names in ``path``, for constant-time cycle checks.
+                Built from ``path`` when not given.
 
         Returns:
             List of Task objects in execution order.
@@ -206,40 +243,57 @@ class TaskExecutor:
             visited = set()
         if path is None:
             path = []
-
-        # Check for cycles
-        if name in path:
-            raise CycleDetectedError(path + [name])
+        if on_path is None:
+            on_path = set(path)
 
         # Get the task definition
         task_def = self.task_definitions.get(name)
         if task_def is None:
-            raise TaskNotFoundError(name, list(self.task_definitions.keys()))
+            raise TaskNotFoundError(name, self.task_definitions)
 
-        # If it's a simple task, return it
-        if not is_pipeline(task_def):
+        # If it's a simple task, return it; only pipelines can form a cycle
+        if not task_def.is_pipeline:
             return [task_def]  # type: ignore[list-item]
 
+        # Check for cycles
+        if name in on_path:
+            raise CycleDetectedError(path + [name])
+
+        # A pipeline expanded before is acyclic, so its steps can be reused
+        cached = self._expand_cache.get(name)
+        if cached is not None:
+            visited.add(name)
+            return list(cached)
+
         # It's a pipeline - expand it
         pipeline: Pipeline = task_def  # type: ignore[assignment]
         expanded: list[Task] = []
-        new_path = path + [name]
 
-        for step in pipeline.steps:
-            if isinstance(step, str):
-                # It's a reference to another task/pipeline
-                expanded.extend(self.expand_pipeline(step, visited, new_path))
-            else:
-                # It's an inline Task
-                expanded.append(step)
+        # Extend the path in place for the recursion rather than copying it
+        path.append(name)
+        on_path.add(name)
+        try:
+            for step in pipeline.steps:
+                if isinstance(step, str):
+                    # It's a reference to another task/pipeline
+                    expanded.extend(self.expand_pipeline(step, visited, path, on_path))
+                else:
+                    # It's an inline Task
+                    expanded.append(step)
+        finally:
+            path.pop()
+            on_path.discard(name)
 
         visited.add(name)
-        return expanded
+        self._expand_cache[name] = expanded
+        return list(expanded)
 
     def _build_env(self, task: Task) -> dict[str, str]:
         """Build the environment for a task execution.
 
-        Combines the current environment with task-specific overrides.
+        Combines the current environment with task-specific overrides. The
+        result is cached per set of overrides, so pipeline steps sharing an
+        env reuse one copy of ``os.environ``; callers must not mutate it.
 
         Args:
             task: The task to build the environment for.
@@ -247,19 +301,24 @@ class TaskExecutor:
         Returns:
             Environment dictionary for subprocess execution.
         """
-        env = os.environ.copy()
+        key = frozenset(task.env.items()) if task.env else frozenset()
+        env = self._env_cache.get(key)
+        if env is None:
+            env = os.environ.copy()
 
-        # Apply task-specific environment overrides
-        if task.env:
-            env.update(task.env)
+            # Apply task-specific environment overrides
+            if task.env:
+                env.update(task.env)
 
+            self._env_cache[key] = env
         return env
 
     def _get_executable_path(self, task: Task) -> str:
         """Get the executable path for a task.
 
         If use_venv is True and a venv_path is configured, returns the
-        path to the executable within the venv.
+        path to the executable within the venv. The venv lookup is done once
+        per command for the executor's lifetime.
 
         Args:
             task: The task to get the executable for.
@@ -267,30 +326,115 @@ class TaskExecutor:
         Returns:
             Path to the executable.
         """
-        command = task.command
+        if not (task.use_venv and self.venv_path):
+            return task.command
+
+        key = (self.venv_path, task.command)
+        cached = self._venv_exec_cache.get(key)
+        if cached is None:
+            cached = self._venv_exec_cache[key] = self._find_in_venv(self.venv_path, task.command)
+        return cached
+
+    @staticmethod
+    def _find_in_venv(venv_path: Path, command: str) -> str:
+        """Look a command up in a venv.
+
+        Args:
+            venv_path: Path to the virtual environment.
+            command: The task's command.
+
+        Returns:
+            Path to the command inside the venv, or the command unchanged if
+            the venv does not provide it.
+        """
+        # Try to find the command in the venv; which() applies PATHEXT on
+        # Windows, so e.g. "pytest" finds Scripts/pytest.exe
+        venv_bin = str(venv_path / ("Scripts" if sys.platform == "win32" else "bin"))
+        found = shutil.which(command, path=venv_bin)
+
+        # For python, try to use the venv python
+        if found is None and command in ("python", "python3"):
+            found = shutil.which("python", path=venv_bin)
+
+        return found or command
+
+    def _group_steps(self, tasks: list[Task]) -> list[list[Task]]:
+        """Group consecutive pipeline steps that can share one shell process.
+
+        Steps are grouped only when fusing is enabled, not in dry-run mode,
+        and on POSIX platforms; otherwise every step is its own group.
+
+        Args:
+            tasks: Expanded pipeline steps in execution order.
+
+        Returns:
+            Groups of steps, in execution order.
+        """
+        if not self.fuse_steps or self.dry_run or sys.platform == "win32":
+            return [[task] for task in tasks]
 
-        if task.use_venv and self.venv_path:
-            # Try to find the command in the venv
-            if sys.platform == "win32":
-                venv_bin = self.venv_path / "Scripts"
+        groups: list[list[Task]] = []
+        for task in tasks:
+            last = groups[-1][-1] if groups else None
+            if last is not None and (last.env, last.working_dir) == (task.env, task.working_dir):
+                groups[-1].append(task)
             else:
-                venv_bin = self.venv_path / "bin"
+                groups.append([task])
+        return groups
 
-            # Check for the command in venv
-            venv_cmd = venv_bin / command
-            if venv_cmd.exists():
-                return str(venv_cmd)
+    def _fuse(self, tasks: list[Task]) -> Task:
+        """Combine steps into one task that runs them with ``&&`` in a shell.
 
-            # For python, try to use the venv python
-            if command in ("python", "python3"):
-                if sys.platform == "win32":
-                    venv_python = venv_bin / "python.exe"
-                else:
-                    venv_python = venv_bin / "python"
-                if venv_python.exists():
-                    return str(venv_python)
+        Each step's executable is resolved (including venv lookup) before
+        quoting, so the fused task itself does not use the venv.
+
+        Args:
+            tasks: Steps sharing the same env and working_dir.
 
-        return command
+        Returns:
+            A task named ``a+b+...`` that runs the steps in order and stops
+            at the first failure.
+        """
+        script = " && ".join(
+            shlex.join([self._get_executable_path(task), *task.args]) for task in tasks
+        )
+        first = tasks[0]
+        return Task(
+            name="+".join(task.name for task in tasks),
+            command="/bin/sh",
+            args=["-c", script],
+            use_venv=False,
+            env=first.env,
+            working_dir=first.working_dir,
+        )
+
+    def _resolve_command(self, command: str, env: dict[str, str] | None) -> str:
+        """Resolve a bare command name to an absolute path.
+
+        Lookups against our own PATH are cached for the executor's lifetime;
+        tasks that override PATH are resolved against it uncached. Commands
+        that already contain a directory, or that cannot be found, are
+        returned unchanged.
+
+        Args:
+            command: The executable name or path.
+            env: The task's environment overrides, if any.
+
+        Returns:
+            The absolute path of the command, or ``command`` itself.
+        """
+        if os.path.dirname(command):
+            return command
+        if env and "PATH" in env:
+            resolved = shutil.which(command, path=env["PATH"])
+            return resolved if resolved and os.path.isabs(resolved) else command
+
+        cached = self._which_cache.get(command)
+        if cached is None:
+            resolved = shutil.which(command)
+            cached = resolved if resolved and os.path.isabs(resolved) else command
+            self._which_cache[command] = cached
+        return cached
 
     def execute_task(self, task: Task) -> ExecutionResult:
         """Execute a single task.
@@ -303,40 +447,65 @@ class TaskExecutor:
         """
         executable = self._get_executable_path(task)
         command_list = [executable, *task.args]
-        env = self._build_env(task)
 
-        # Determine working directory
-        working_dir = self.project_root
-        if task.working_dir:
-            working_dir = self.project_root / task.working_dir
-
-        # Log the command
-        cmd_str = " ".join(command_list)
+        # Log the command; the join is skipped when the message is filtered
         if self.dry_run:
-            self._log(task.name, f"Would run: {cmd_str}", level=0)
+            if self.verbosity >= 0:
+                self._log(task.name, f"Would run: {' '.join(command_list)}", level=0)
             return ExecutionResult(
                 task_name=task.name,
                 exit_code=0,
                 skipped=True,
             )
 
-        self._log(task.name, f"Running: {cmd_str}", level=1)
+        # Without overrides the child simply inherits our environment
+        env = self._build_env(task) if task.env else None
+
+        # Determine working directory
+        working_dir = self.project_root
+        if task.working_dir:
+            working_dir = self.project_root / task.working_dir
+
+        if self.verbosity >= 1:
+            self._log(task.name, f"Running: {' '.join(command_list)}", level=1)
+
+        # Quiet mode discards child output, verbose mode lets it go straight
+        # to the terminal, and normal mode shows stdout but keeps stderr to
+        # report alongside a failure.
+        capture_stderr = self.verbosity == 0
+        if self.verbosity < 0:
+            stdout: int | None = subprocess.DEVNULL
+            stderr: int | None = subprocess.DEVNULL
+        else:
+            stdout = None
+            stderr = subprocess.PIPE if capture_stderr else None
+
+        command_list[0] = self._resolve_command(executable, task.env)
 
         try:
             # Execute the command with explicit arg list (shell=False)
+            # Omitting cwd when it is already ours, and close_fds=False (our fds
+            # are non-inheritable anyway), lets CPython use posix_spawn
             result = subprocess.run(
                 command_list,
-                cwd=working_dir,
+                cwd=None if str(working_dir) == os.getcwd() else working_dir,
                 env=env,
-                capture_output=self.verbosity < 1,  # Capture output in normal and quiet modes
-                text=True,
+                stdout=stdout,
+                stderr=stderr,
+                text=capture_stderr,
+                close_fds=False,
             )
 
-            output = ""
-            if result.stdout:
-                output += result.stdout
-            if result.stderr:
-                output += result.stderr
+            output = result.stderr if capture_stderr and result.stderr else ""
+
+            if result.returncode != 0 and output:
+                sys.stderr.write(output if output.endswith("\n") else output + "\n")
+
+            # The full stderr has been shown; keep only its tail, so a
+            # pipeline's results do not hold every task's output at once
+            keep = MAX_OUTPUT_LINES + output.endswith("\n")
+            if output.count("\n") >= keep:
+                output = "\n".join(output.rsplit("\n", keep)[1:])
 
             if result.returncode != 0:
                 self._log(task.name, f"Failed with exit code {result.returncode}", level=-1)
@@ -372,6 +541,148 @@ class TaskExecutor:
                 error=error_msg,
             )
 
+    def _flatten(self, name: str) -> list[Task | Pipeline]:
+        """Expand a task or pipeline into steps, keeping parallel pipelines whole.
+
+        Must only be called after ``expand_pipeline`` has checked the name
+        for missing tasks and cycles.
+
+        Args:
+            name: Name of the task or pipeline.
+
+        Returns:
+            Tasks in execution order, with each parallel pipeline left as a
+            single item to be run by ``_run_parallel``.
+        """
+        task_def = self.task_definitions[name]
+        if not task_def.is_pipeline:
+            return [task_def]  # type: ignore[list-item]
+        pipeline: Pipeline = task_def  # type: ignore[assignment]
+        if pipeline.parallel:
+            return [pipeline]
+        items: list[Task | Pipeline] = []
+        for step in pipeline.steps:
+            if isinstance(step, str):
+                items.extend(self._flatten(step))
+            else:
+                items.append(step)
+        return items
+
+    def _run_sequence(
+        self, pipeline_name: str, items: list[Task | Pipeline], stop: threading.Event
+    ) -> list[ExecutionResult]:
+        """Run flattened steps in order until one fails or ``stop`` is set.
+
+        Runs of consecutive tasks are grouped (and possibly fused) as usual;
+        parallel pipelines among the items are run by ``_run_parallel``.
+
+        Args:
+            pipeline_name: Name of the pipeline being run, for logging.
+            items: Steps from ``_flatten``.
+            stop: Event shared by the whole run. Set here when a step fails.
+
+        Returns:
+            A result for each task (or fused group) that ran, in order.
+        """
+        results: list[ExecutionResult] = []
+        start = 0
+        while start < len(items) and not stop.is_set():
+            item = items[start]
+            if isinstance(item, Pipeline):
+                results.extend(self._run_parallel(pipeline_name, item, stop))
+                start += 1
+                continue
+
+            end = start
+            while end < len(items) and isinstance(items[end], Task):
+                end += 1
+            tasks: list[Task] = items[start:end]  # type: ignore[assignment]
+            start = end
+
+            for group in self._group_steps(tasks):
+                if stop.is_set():
+                    break
+                task = group[0] if len(group) == 1 else self._fuse(group)
+                self._log(pipeline_name, f"Running step: {task.name}", level=0)
+                result = self.execute_task(task)
+                results.append(result)
+
+                # Short-circuit on failure
+                if result.exit_code != 0:
+                    self._log(
+                        pipeline_name,
+                        f"Pipeline short-circuited at '{task.name}' "
+                        f"with exit code {result.exit_code}",
+                        level=-1,
+                    )
+                    stop.set()
+        return results
+
+    def _run_parallel(
+        self, pipeline_name: str, pipeline: Pipeline, stop: threading.Event
+    ) -> list[ExecutionResult]:
+        """Run a parallel pipeline's steps concurrently.
+
+        Each step runs on its own thread through ``_run_sequence``, so a step
+        naming a sequential pipeline still runs that pipeline in order.
+
+        Args:
+            pipeline_name: Name of the pipeline being run, for logging.
+            pipeline: The parallel pipeline.
+            stop: Event shared by the whole run.
+
+        Returns:
+            The results of every step, grouped by step in declaration order.
+        """
+        # Only parallel pipelines need a thread pool
+        from concurrent.futures import ThreadPoolExecutor
+
+        lanes = [
+            self._flatten(step) if isinstance(step, str) else [step] for step in pipeline.steps
+        ]
+        if not lanes:
+            return []
+        # One thread per step: each mostly waits on its child process
+        with ThreadPoolExecutor(max_workers=len(lanes)) as pool:
+            futures = [
+                pool.submit(self._run_sequence, pipeline_name, lane, stop) for lane in lanes
+            ]
+        return [result for future in futures for result in future.result()]
+
+    def _preview_pipeline(self, pipeline_name: str, tasks: list[Task]) -> PipelineResult:
+        """Show what a pipeline would run, without per-step execution setup.
+
+        The preview lines match those of a step-by-step dry run, but are
+        written to stderr in a single write when no log callback is set.
+
+        Args:
+            pipeline_name: Name of the pipeline being previewed.
+            tasks: Expanded pipeline steps in execution order.
+
+        Returns:
+            PipelineResult with a skipped ExecutionResult per step.
+        """
+        pipeline_result = PipelineResult(pipeline_name=pipeline_name)
+        entries: list[tuple[str, str]] = []
+
+        for task in tasks:
+            pipeline_result.results.append(
+                ExecutionResult(task_name=task.name, exit_code=0, skipped=True)
+            )
+            if self.verbosity >= 0:
+                command = " ".join([self._get_executable_path(task), *task.args])
+                entries.append((pipeline_name, f"Running step: {task.name}"))
+                entries.append((task.name, f"Would run: {command}"))
+
+        if self.log_callback:
+            for phase, message in entries:
+                self.log_callback(phase, message, 0)
+        elif entries:
+            sys.stderr.write("".join(f"[{phase}] {message}\n" for phase, message in entries))
+
+        self._log(pipeline_name, "Pipeline completed successfully", level=0)
+        return pipeline_result
+
     def run(self, task_name: str) -> ExecutionResult | PipelineResult:
         """Run a task or pipeline by name.
 
@@ -390,10 +701,10 @@ class TaskExecutor:
         """
         task_def = self.task_definitions.get(task_name)
         if task_def is None:
-            raise TaskNotFoundError(task_name, list(self.task_definitions.keys()))
+            raise TaskNotFoundError(task_name, self.task_definitions)
 
         # If it's a simple task, execute it directly
-        if not is_pipeline(task_def):
+        if not task_def.is_pipeline:
             task: Task = task_def  # type: ignore[assignment]
             self._log(task.name, "Starting task", level=0)
             result = self.execute_task(task)
@@ -404,29 +715,18 @@ class TaskExecutor:
         # It's a pipeline - expand and execute
         self._log(task_name, "Starting pipeline", level=0)
 
-        try:
-            tasks = self.expand_pipeline(task_name)
-        except CycleDetectedError:
-            raise
-        except TaskNotFoundError:
-            raise
-
-        pipeline_result = PipelineResult(pipeline_name=task_name)
+        tasks = self.expand_pipeline(task_name)
 
-        for task in tasks:
-            self._log(task_name, f"Running step: {task.name}", level=0)
-            result = self.execute_task(task)
-            pipeline_result.results.append(result)
+        if self.dry_run:
+            return self._preview_pipeline(task_name, tasks)
 
-            # Short-circuit on failure
-            if result.exit_code != 0:
-                self._log(
-                    task_name,
-                    f"Pipeline short-circuited at '{task.name}' with exit code {result.exit_code}",
-                    level=-1,
-                )
-                pipeline_result.short_circuited = True
-                break
+        # Set by the first failing step, stopping every remaining step
+        stop = threading.Event()
+        pipeline_result = PipelineResult(
+            pipeline_name=task_name,
+            results=self._run_sequence(task_name, self._flatten(task_name), stop),
+            short_circuited=stop.is_set(),
+        )
 
         if pipeline_result.success:
             self._log(task_name, "Pipeline completed successfully", level=0)
@@ -455,7 +755,8 @@ def create_executor_from_config(
         venv_path: Path to the virtual environment.
 
     Returns:
-        Configured TaskExecutor instance.
+        Configured TaskExecutor instance. Pipeline step fusing is enabled
+        when the config sets ``fast_pipeline``.
 
     Example:
         >>> config = {
@@ -466,27 +767,10 @@ def create_executor_from_config(
         ... }
         >>> executor = create_executor_from_config(config)
     """
-    task_definitions: dict[str, TaskDefinition] = {}
-
-    tasks_config = config.get("tasks", {})
-
-    for name, task_config in tasks_config.items():
-        if "pipeline" in task_config:
-            # It's a pipeline
-            task_definitions[name] = Pipeline(
-                name=name,
-                steps=task_config["pipeline"],
-            )
-        else:
-            # It's a task
-            task_definitions[name] = Task(
-                name=name,
-                command=task_config.get("command", ""),
-                args=task_config.get("args", []),
-                use_venv=task_config.get("use_venv", True),
-                env=task_config.get("env"),
-                working_dir=task_config.get("working_dir"),
-            )
+    task_definitions = {
+        name: _definition_from_config(name, task_config)
+        for name, task_config in config.get("tasks", {}).items()
+    }
 
     return TaskExecutor(
         task_definitions=task_definitions,
@@ -494,4 +778,32 @@ def create_executor_from_config(
         dry_run=dry_run,
         verbosity=verbosity,
         venv_path=venv_path,
+        fuse_steps=bool(config.get("fast_pipeline", False)),
+    )
+
+
+def _definition_from_config(name: str, task_config: dict[str, Any]) -> TaskDefinition:
+    """Build a Task or Pipeline from one entry of the ``tasks`` config.
+
+    Args:
+        name: The task name.
+        task_config: The task's config table.
+
+    Returns:
+        A Pipeline if the entry has a ``pipeline`` key, otherwise a Task.
+    """
+    get = task_config.get
+    if "pipeline" in task_config:
+        return Pipeline(
+            name=name,
+            steps=task_config["pipeline"],
+            parallel=bool(get("parallel", False)),
+        )
+    return Task(
+        name=name,
+        command=get("command", ""),
+        args=get("args", []),
+        use_venv=get("use_venv", True),
+        env=get("env"),
+        working_dir=get("working_dir"),
     )
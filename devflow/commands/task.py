@@ -10,16 +10,18 @@ Ownership: Workstream B (task/registry)
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Union
+from typing import ClassVar, Union
 
+from devflow.core.compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Task:
     """A single executable task in devflow.
 
     Tasks represent atomic operations like running a command or script.
     They support venv-aware execution, environment variable overrides,
-    and configurable argument lists.
+    and configurable argument lists. Instances are immutable.
 
     Attributes:
         name: Unique identifier for the task.
@@ -39,6 +41,9 @@ class Task:
         ... )
     """
 
+    # Class-level tag, so the executor dispatches without isinstance()
+    is_pipeline: ClassVar[bool] = False
+
     name: str
     command: str
     args: list[str] = field(default_factory=list)
@@ -55,7 +60,7 @@ class Task:
         return [self.command, *self.args]
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Pipeline:
     """A sequence of tasks that execute in order.
 
@@ -63,9 +68,14 @@ class Pipeline:
     on failure. If any task in the pipeline fails (non-zero exit code),
     subsequent tasks are not executed.
 
+    A parallel pipeline runs its steps concurrently instead, each step (and
+    any pipeline it names) in order on its own thread. Once a step fails, no
+    further tasks are started anywhere in the run.
+
     Attributes:
         name: Unique identifier for the pipeline.
         steps: List of task names (strings) or Task objects that make up the pipeline.
+        parallel: Whether the steps run concurrently rather than in order.
 
     Example:
         >>> pipeline = Pipeline(
@@ -74,8 +84,12 @@ class Pipeline:
         ... )
     """
 
+    # Class-level tag, so the executor dispatches without isinstance()
+    is_pipeline: ClassVar[bool] = True
+
     name: str
     steps: list[str | Task] = field(default_factory=list)
+    parallel: bool = False
 
 
 # Type alias for task definitions that can be either a Task or Pipeline
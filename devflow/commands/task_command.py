@@ -0,0 +1,123 @@
+"""The `devflow task <name>` command.
+
+This module wires config-defined tasks and pipelines to the TaskExecutor.
+It is imported lazily by the CLI, only when the `task` command runs.
+
+Ownership: Workstream B (task/registry)
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Any, Callable
+
+from devflow.commands.base import Command
+from devflow.commands.executor import (
+    CycleDetectedError,
+    TaskNotFoundError,
+    create_executor_from_config,
+)
+from devflow.core.paths import get_venv_dir
+
+if TYPE_CHECKING:
+    from typing import Optional
+
+    from devflow.commands.base import AppContext
+
+
+class TaskCommand(Command):
+    """Run a custom task or pipeline defined in config."""
+
+    name = "task"
+    help = "Run custom tasks defined in config"
+
+    def list_tasks(self) -> list[str]:
+        """List the names of all configured tasks.
+
+        Returns:
+            Sorted list of task names.
+        """
+        # Only the names are needed, so skip serializing the whole config
+        return sorted(self.app.config.tasks)
+
+    def run(
+        self, task_name: Optional[str] = None, list_tasks: bool = False, **kwargs: Any
+    ) -> int:
+        """Run a task, or list the available tasks.
+
+        Generic entry point for registry dispatch; the CLI calls
+        ``print_tasks`` and ``run_task`` directly.
+
+        Args:
+            task_name: Name of the task or pipeline to run. If None, the
+                available tasks are listed instead.
+            list_tasks: List the available tasks instead of running one.
+            **kwargs: Unused; accepted for Command compatibility.
+
+        Returns:
+            Exit code: 0 for success, otherwise the failing task's exit code
+            (1 for unknown tasks and pipeline cycles).
+        """
+        if list_tasks or task_name is None:
+            return self.print_tasks()
+        return self.run_task(task_name)
+
+    def print_tasks(self) -> int:
+        """Print the names of all configured tasks to stdout.
+
+        Returns:
+            Exit code, always 0.
+        """
+        names = self.list_tasks()
+        # One write for the whole listing rather than one print per task
+        print("\n".join(names) if names else "No tasks defined in config.")
+        return 0
+
+    def run_task(self, task_name: str) -> int:
+        """Run a task or pipeline by name.
+
+        Args:
+            task_name: Name of the task or pipeline to run.
+
+        Returns:
+            Exit code: 0 for success, otherwise the failing task's exit code
+            (1 for unknown tasks and pipeline cycles).
+        """
+        executor = create_executor_from_config(
+            self.app.config.to_dict(),
+            project_root=self.app.project_root,
+            dry_run=self.app.dry_run,
+            verbosity=self.app.verbosity,
+            venv_path=get_venv_dir(self.app.project_root, self.app.config.venv_dir),
+        )
+
+        try:
+            result = executor.run(task_name)
+        except (TaskNotFoundError, CycleDetectedError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        return result.exit_code
+
+
+def create_task_typer_command(app: AppContext) -> Callable[..., None]:
+    """Create the callback that backs `devflow task`.
+
+    Args:
+        app: The application context.
+
+    Returns:
+        A callback taking ``task_name`` and ``list_tasks`` that raises
+        SystemExit with the task's exit code on failure.
+    """
+
+    def callback(task_name: Optional[str] = None, list_tasks: bool = False) -> None:
+        command = TaskCommand(app)
+        if list_tasks or task_name is None:
+            exit_code = command.print_tasks()
+        else:
+            exit_code = command.run_task(task_name)
+        if exit_code != 0:
+            raise SystemExit(exit_code)
+
+    return callback
@@ -6,16 +6,25 @@ Implements configuration discovery order:
 3. devflow.toml in project root
 4. User-level default (~/.config/devflow/config.toml) - placeholder hook
 5. Built-in defaults
+
+Loaded configurations are cached in memory and pickled to the devflow
+cache directory, keyed by the stat signature of every candidate config
+file, so warm runs skip TOML parsing and schema construction entirely.
 """
 
 from __future__ import annotations
 
+import hashlib
+import os
+import pickle
 import sys
 from pathlib import Path
 from typing import Any
 
+from devflow._version import __version__
 from devflow.config.defaults import DEFAULT_CONFIG
 from devflow.config.schema import DevflowConfig
+from devflow.core.cache import atomic_write_bytes, get_cache_dir
 
 # Use tomllib for Python 3.11+, fall back to tomli for earlier versions
 if sys.version_info >= (3, 11):
@@ -74,9 +83,17 @@ def find_config_file(project_root: Path, explicit_config: Path | None = None) ->
     return None
 
 
+# Bump when the DevflowConfig schema changes to invalidate cached configs
+CONFIG_CACHE_VERSION = 2
+
+# In-process cache of loaded configs, keyed by _config_cache_key()
+_config_memo: dict[tuple[Any, ...], DevflowConfig] = {}
+
+
 def load_config(
     project_root: Path,
     explicit_config: Path | None = None,
+    use_cache: bool = True,
 ) -> DevflowConfig:
     """Load devflow configuration.
 
@@ -86,13 +103,97 @@ def load_config(
     3. Merge project config (pyproject.toml or devflow.toml)
     4. If explicit --config given, use that instead of project config
 
+    Results are cached in memory and on disk. The cache key covers the
+    devflow version, the schema version, and the path, mtime and size of
+    every config file that could contribute, so editing, adding or
+    removing any of them invalidates the entry.
+
     Args:
         project_root: The project root directory.
         explicit_config: An explicit config path provided via --config.
+        use_cache: Whether to use cached results.
 
     Returns:
         The merged DevflowConfig.
     """
+    if not use_cache:
+        return _load_config_uncached(project_root, explicit_config)
+
+    key = _config_cache_key(project_root, explicit_config)
+    config = _config_memo.get(key)
+    if config is not None:
+        return config
+
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+    cache_file = get_cache_dir() / "config" / digest
+    config = _read_cached_config(cache_file)
+    if config is None:
+        config = _load_config_uncached(project_root, explicit_config)
+        _write_cached_config(cache_file, config)
+
+    _config_memo[key] = config
+    return config
+
+
+def _config_cache_key(project_root: Path, explicit_config: Path | None) -> tuple[Any, ...]:
+    """Build the cache key for a load_config() call.
+
+    Args:
+        project_root: The project root directory.
+        explicit_config: An explicit config path provided via --config.
+
+    Returns:
+        A hashable key describing every input that affects the result.
+    """
+    candidates = [Path.home() / ".config" / "devflow" / "config.toml"]
+    if explicit_config is not None:
+        candidates.append(explicit_config)
+    else:
+        candidates.append(project_root / "pyproject.toml")
+        candidates.append(project_root / "devflow.toml")
+
+    signatures: list[tuple[str, int, int] | tuple[str, None, None]] = []
+    for path in candidates:
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            signatures.append((str(path), None, None))
+        else:
+            signatures.append((str(path), stat_result.st_mtime_ns, stat_result.st_size))
+
+    return (__version__, CONFIG_CACHE_VERSION, str(project_root), *signatures)
+
+
+def _read_cached_config(cache_file: Path) -> DevflowConfig | None:
+    """Read a pickled config from the disk cache.
+
+    Returns:
+        The cached DevflowConfig, or None if missing or unreadable.
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            config = pickle.load(f)
+    except Exception:
+        return None
+    return config if isinstance(config, DevflowConfig) else None
+
+
+def _write_cached_config(cache_file: Path, config: DevflowConfig) -> None:
+    """Pickle a config to the disk cache, ignoring failures."""
+    try:
+        atomic_write_bytes(cache_file, pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL))
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+def _load_config_uncached(
+    project_root: Path,
+    explicit_config: Path | None = None,
+) -> DevflowConfig:
+    """Load devflow configuration without consulting any cache.
+
+    See load_config() for the discovery and merging order.
+    """
     config = DEFAULT_CONFIG
 
     # 1. Try user-level config first (as base layer)
@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True)
 class PathsConfig:
     """Configuration for project paths."""
 
@@ -19,7 +19,7 @@ class PathsConfig:
     src_dir: str = "src"
 
 
-@dataclass
+@dataclass(frozen=True)
 class PublishConfig:
     """Configuration for publish operations."""
 
@@ -31,16 +31,18 @@ class PublishConfig:
     require_clean_working_tree: bool = True
 
 
-@dataclass
+@dataclass(frozen=True)
 class DepsConfig:
     """Configuration for dependency management."""
 
     requirements: str = "requirements.txt"
     dev_requirements: str = "requirements-dev.txt"
     freeze_output: str = "requirements-freeze.txt"
+    # Package installer used by deps sync: "pip", or "uv" when available
+    installer: str = "pip"
 
 
-@dataclass
+@dataclass(frozen=True)
 class TaskConfig:
     """Configuration for a single task or pipeline."""
 
@@ -51,9 +53,11 @@ class TaskConfig:
     # For pipelines/composite tasks
     pipeline: list[str] | None = None
     steps: list[str] | None = None
+    # Run the pipeline's steps concurrently
+    parallel: bool | None = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class DevflowConfig:
     """Main configuration schema for devflow.
 
@@ -69,6 +73,8 @@ class DevflowConfig:
 
     # Boolean flags
     auto_discover_tasks: bool = True
+    # Run consecutive pipeline steps with matching env/working_dir in one shell
+    fast_pipeline: bool = False
 
     # Nested configurations
     paths: PathsConfig = field(default_factory=PathsConfig)
@@ -117,19 +123,21 @@ class DevflowConfig:
             **data,
         )
 
-    def merge_with(self, overrides: dict[str, Any]) -> DevflowConfig:
-        """Merge this config with overrides, returning a new config.
+    def to_dict(self) -> dict[str, Any]:
+        """Convert this config to a plain dictionary.
 
-        Overrides take precedence over existing values.
+        The result round-trips through ``from_dict``. Task keys whose value
+        is None are omitted, so pipelines and plain tasks can be told apart
+        by the presence of a ``pipeline`` key.
         """
-        # Start with current config as a dict
-        current = {
+        return {
             "venv_dir": self.venv_dir,
             "default_python": self.default_python,
             "build_backend": self.build_backend,
             "test_runner": self.test_runner,
             "package_index": self.package_index,
             "auto_discover_tasks": self.auto_discover_tasks,
+            "fast_pipeline": self.fast_pipeline,
             "version_source": self.version_source,
             "paths": {
                 "dist_dir": self.paths.dist_dir,
@@ -148,20 +156,34 @@ class DevflowConfig:
                 "requirements": self.deps.requirements,
                 "dev_requirements": self.deps.dev_requirements,
                 "freeze_output": self.deps.freeze_output,
+                "installer": self.deps.installer,
             },
             "tasks": {
                 name: {
-                    "command": task.command,
-                    "args": task.args,
-                    "use_venv": task.use_venv,
-                    "env": task.env,
-                    "pipeline": task.pipeline,
-                    "steps": task.steps,
+                    key: value
+                    for key, value in (
+                        ("command", task.command),
+                        ("args", task.args),
+                        ("use_venv", task.use_venv),
+                        ("env", task.env),
+                        ("pipeline", task.pipeline),
+                        ("steps", task.steps),
+                        ("parallel", task.parallel),
+                    )
+                    if value is not None
                 }
                 for name, task in self.tasks.items()
             },
         }
 
+    def merge_with(self, overrides: dict[str, Any]) -> DevflowConfig:
+        """Merge this config with overrides, returning a new config.
+
+        Overrides take precedence over existing values.
+        """
+        # Start with current config as a dict
+        current = self.to_dict()
+
         # Deep merge overrides
         _deep_merge(current, overrides)
 
@@ -0,0 +1,52 @@
+"""On-disk cache helpers for devflow.
+
+Provides the location of the per-user cache directory and an atomic
+write helper so that concurrent devflow processes never observe a
+partially written cache file.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+
+
+def get_cache_dir() -> Path:
+    """Get the devflow cache directory.
+
+    Honors ``$XDG_CACHE_HOME`` and falls back to ``~/.cache``. The
+    directory is not created by this function.
+
+    Returns:
+        Path to the devflow cache directory.
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "devflow"
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Atomically write bytes to a file.
+
+    The data is written to a temporary file in the same directory and then
+    moved into place with ``os.replace``. Parent directories are created
+    as needed.
+
+    Args:
+        path: Destination file path.
+        data: Bytes to write.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
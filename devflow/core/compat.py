@@ -0,0 +1,9 @@
+"""Compatibility helpers for the range of Python versions devflow supports."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+# dataclass(slots=True) is only available on Python 3.10+
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
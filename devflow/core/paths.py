@@ -10,58 +10,206 @@ from __future__ import annotations
 import os
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from typing import Optional
 
+# Marker files that identify a project root, in order of preference
+PROJECT_ROOT_MARKERS = ("pyproject.toml", "devflow.toml")
+_MARKER_NAMES = frozenset(PROJECT_ROOT_MARKERS)
 
-def find_project_root(start: Optional[Path] = None) -> Path:
-    """Walk upward from start until finding pyproject.toml or devflow.toml.
+# Upper bound on the number of entries kept in the project-root cache
+_ROOT_CACHE_MAX_ENTRIES = 256
 
-    Args:
-        start: Starting directory. Defaults to current working directory.
-from pathlib import Path
+# In-process cache of project-root lookups, keyed by start directory
+_memory_root_cache: dict[str, dict[str, Any]] = {}
 
 
-class ProjectRootNotFoundError(Exception):
+class ProjectRootNotFoundError(RuntimeError):
     """Raised when project root cannot be detected."""
 
-def find_project_root(start: Path | None = None) -> Path:
+
+def find_project_root(start: Path | None = None, use_cache: bool = True) -> Path:
     """Find the project root by walking upward from start directory.
 
     The project root is identified by the presence of either:
     - pyproject.toml
     - devflow.toml
 
+    Results are cached per directory: the starting directory and every
+    ancestor passed on the way to the root are recorded, so a later lookup
+    from a sibling directory stops at the first cached ancestor. The cache
+    lives only for the current process: reading a cache file back costs
+    more than the walk it would save.
+
+    A cached root is revalidated by stat'ing its marker file and every
+    directory between the cached directory and the root. Creating or
+    removing a marker changes its directory's mtime, so a closer marker
+    appearing, or the root's marker changing, invalidates the entry.
+
     Args:
         start: Starting directory for the search. Defaults to current directory.
+        use_cache: Whether to consult the cache. When False the walk is
+            always performed and the cache entry is refreshed.
 
     Returns:
         Path to the project root directory.
 
     Raises:
-        RuntimeError: If no project root marker is found.
+        ProjectRootNotFoundError: If no project root markers are found.
     """
     if start is None:
         start = Path.cwd()
-    else:
-        start = Path(start).resolve()
 
-    current = start
-    while current != current.parent:
-        if (current / "pyproject.toml").exists() or (current / "devflow.toml").exists():
-            return current
-        current = current.parent
+    # Ensure we have an absolute path
+    current = Path(start).resolve()
+    key = str(current)
+
+    cache = _memory_root_cache
+    if use_cache:
+        cached = _lookup_cached_root(cache, key)
+        if cached is not None:
+            return cached
+
+    visited: list[str] = []
+    entry = _walk_for_project_root(current, start, visited, cache if use_cache else None)
+
+    # Every directory passed on the way up had no marker of its own, so it
+    # resolves to the same root; caching them lets lookups from sibling
+    # directories stop as soon as they reach a shared ancestor. Each one
+    # keeps the directory mtimes from itself up to the root.
+    dirs = entry["dirs"]
+    for index, visited_key in enumerate(visited):
+        cache.pop(visited_key, None)
+        cache[visited_key] = {**entry, "dirs": dirs[index:]}
+    while len(cache) > _ROOT_CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+
+    return Path(entry["root"])
+
+
+def _walk_for_project_root(
+    current: Path,
+    start: Path,
+    visited: list[str],
+    cache: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Walk upward from current until a project root marker is found.
+
+    Args:
+        current: Absolute directory to start walking from.
+        start: The directory as originally given (used in the error message).
+        visited: List that receives each directory checked, starting with
+            current and ending with the root (or the directory below the
+            cached ancestor).
+        cache: Optional cache consulted for every ancestor of current; a
+            valid entry ends the walk early.
+
+    Returns:
+        Cache entry with the root directory, marker file name, marker mtime
+        in ns, and ``dirs``: ``[path, mtime_ns]`` pairs for each directory
+        from current up to, but not including, the root.
+
+    Raises:
+        ProjectRootNotFoundError: If no project root markers are found.
+    """
+    dirs: list[list[Any]] = []
+    while True:
+        key = str(current)
+        # The starting directory itself was already looked up by the caller
+        if cache is not None and visited:
+            cached = _lookup_cached_root(cache, key)
+            if cached is not None:
+                entry = cache[key]
+                return {**entry, "dirs": dirs + entry["dirs"]}
+        visited.append(key)
+
+        # Taken before scanning, so a marker created during the scan still
+        # leaves the recorded mtime stale
+        try:
+            dir_mtime_ns: int | None = os.stat(current).st_mtime_ns
+        except OSError:
+            dir_mtime_ns = None
+
+        # Check for project root markers, stat'ing only the ones present
+        for marker in _scan_for_markers(current):
+            try:
+                stat_result = os.stat(current / marker)
+            except OSError:
+                continue
+            return {
+                "root": key,
+                "marker": marker,
+                "marker_mtime_ns": stat_result.st_mtime_ns,
+                "dirs": dirs,
+            }
+        dirs.append([key, dir_mtime_ns])
+
+        # Move up to parent
+        parent = current.parent
+
+        # Check if we've reached the filesystem root
+        if parent == current:
+            raise ProjectRootNotFoundError(
+                f"Project root not found. Searched from '{start}' to filesystem root. "
+                "Ensure your project has a pyproject.toml or devflow.toml file."
+            )
+
+        current = parent
+
+
+def _scan_for_markers(directory: Path) -> tuple[str, ...]:
+    """Return the project root markers present in a directory.
+
+    Reads the directory once with ``os.scandir`` instead of stat'ing each
+    marker, stopping early once the preferred marker is seen. Directories
+    that cannot be listed fall back to checking every marker.
+
+    Args:
+        directory: Directory to scan.
+
+    Returns:
+        Marker names that may exist in the directory, in order of preference.
+    """
+    found: set[str] = set()
+    try:
+        with os.scandir(directory) as entries:
+            for dir_entry in entries:
+                if dir_entry.name in _MARKER_NAMES:
+                    found.add(dir_entry.name)
+                    if dir_entry.name == PROJECT_ROOT_MARKERS[0]:
+                        break
+    except OSError:
+        return PROJECT_ROOT_MARKERS
+    return tuple(marker for marker in PROJECT_ROOT_MARKERS if marker in found)
 
-    # Check the root itself (e.g., for '/')
-    if (current / "pyproject.toml").exists() or (current / "devflow.toml").exists():
-        return current
 
-    raise RuntimeError(
-        f"Project root not found. No pyproject.toml or devflow.toml found "
-        f"in {start} or any parent directory."
-    )
+def _lookup_cached_root(cache: dict[str, dict[str, Any]], key: str) -> Path | None:
+    """Return the cached root for key if its marker and directories are unchanged.
+
+    Args:
+        cache: The cache mapping start directories to entries.
+        key: The resolved start directory.
+
+    Returns:
+        The cached project root, or None on a miss or stale entry.
+    """
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    try:
+        stat_result = os.stat(os.path.join(entry["root"], entry["marker"]))
+        if stat_result.st_mtime_ns != entry.get("marker_mtime_ns"):
+            return None
+        # A marker created in any directory below the root changes that
+        # directory's mtime
+        for directory, mtime_ns in entry["dirs"]:
+            if os.stat(directory).st_mtime_ns != mtime_ns:
+                return None
+    except (OSError, KeyError, TypeError, ValueError):
+        return None
+    return Path(entry["root"])
 
 
 def get_venv_dir(project_root: Path, venv_dir: str = ".venv") -> Path:
@@ -158,6 +306,55 @@ def venv_exists(venv_dir: Path) -> bool:
     return venv_dir.is_dir() and python_path.exists()
 
 
+def get_venv_site_packages(venv_dir: Path) -> Path | None:
+    """Get the site-packages directory of a virtual environment.
+
+    Args:
+        venv_dir: Path to the virtual environment directory.
+
+    Returns:
+        Path to site-packages, or None if it cannot be found (or is
+        ambiguous because the venv holds several Python versions).
+    """
+    if sys.platform == "win32":
+        site_packages = venv_dir / "Lib" / "site-packages"
+        return site_packages if site_packages.is_dir() else None
+
+    # Scan lib/ by name rather than globbing, which builds a Path per entry
+    lib_dir = venv_dir / "lib"
+    try:
+        with os.scandir(lib_dir) as entries:
+            versions = [entry.name for entry in entries if entry.name.startswith("python")]
+    except OSError:
+        return None
+    candidates = [
+        site_packages
+        for site_packages in (lib_dir / name / "site-packages" for name in versions)
+        if site_packages.is_dir()
+    ]
+    return candidates[0] if len(candidates) == 1 else None
+
+
+def venv_includes_system_site_packages(venv_dir: Path) -> bool:
+    """Check whether a virtual environment can see the system site-packages.
+
+    Args:
+        venv_dir: Path to the virtual environment directory.
+
+    Returns:
+        True if pyvenv.cfg sets ``include-system-site-packages = true``.
+    """
+    try:
+        lines = (venv_dir / "pyvenv.cfg").read_text().splitlines()
+    except OSError:
+        return False
+    for line in lines:
+        key, sep, value = line.partition("=")
+        if sep and key.strip() == "include-system-site-packages":
+            return value.strip().lower() == "true"
+    return False
+
+
 def get_venv_env(venv_dir: Path, extra_env: Optional[dict[str, str]] = None) -> dict[str, str]:
     """Get environment variables for running commands inside a venv.
 
@@ -311,9 +508,8 @@ def has_pyproject_dependencies(project_root: Path) -> bool:
         True if pyproject.toml exists and has dependencies defined.
     """
     pyproject_path = project_root / "pyproject.toml"
-    if not pyproject_path.exists():
-        return False
 
+    # No exists() pre-check: a missing file fails open() and returns False
     try:
         # Use tomllib (Python 3.11+) or tomli as fallback
         try:
@@ -336,32 +532,6 @@ def has_pyproject_dependencies(project_root: Path) -> bool:
 
     except Exception:
         return False
-        ProjectRootNotFoundError: If no project root markers are found.
-    """
-    if start is None:
-        start = Path.cwd()
-
-    # Ensure we have an absolute path
-    current = start.resolve()
-
-    while True:
-        # Check for project root markers
-        if (current / "pyproject.toml").exists():
-            return current
-        if (current / "devflow.toml").exists():
-            return current
-
-        # Move up to parent
-        parent = current.parent
-
-        # Check if we've reached the filesystem root
-        if parent == current:
-            raise ProjectRootNotFoundError(
-                f"Project root not found. Searched from '{start}' to filesystem root. "
-                "Ensure your project has a pyproject.toml or devflow.toml file."
-            )
-
-        current = parent
 
 
 def resolve_path(base: Path, relative: str) -> Path:
@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import os
+import subprocess
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from devflow.commands.deps import DepsManager, create_deps_manager
+from devflow.commands.deps import (
+    DepsManager,
+    create_deps_manager,
+    create_deps_manager_from_config,
+)
 from devflow.commands.venv import VenvManager
+from devflow.config.schema import DevflowConfig
 
 
 class TestDepsManager:
@@ -152,6 +159,33 @@ class TestDepsManager:
         result = manager.list()
         assert result == 0
 
+    def test_venv_python_cached_until_venv_changes(self, tmp_path: Path) -> None:
+        """Test that the venv Python path is computed once per venv_dir."""
+        manager = DepsManager(project_root=tmp_path, venv_dir_name=".venv")
+
+        first = manager.venv_python
+        assert manager.venv_python is first
+        assert first.parent.parent == (tmp_path / ".venv").resolve()
+
+        manager.venv_dir_name = "env"
+        assert manager.venv_python.parent.parent == (tmp_path / "env").resolve()
+
+    def test_has_pyproject_deps_parsed_once_per_root(self, tmp_path: Path) -> None:
+        """Test that pyproject.toml is checked once until project_root changes."""
+        other = tmp_path / "other"
+        other.mkdir()
+        manager = DepsManager(project_root=tmp_path)
+
+        with patch(
+            "devflow.commands.deps.has_pyproject_dependencies", return_value=True
+        ) as mock_check:
+            assert manager.has_pyproject_deps
+            assert manager.has_pyproject_deps
+        mock_check.assert_called_once_with(tmp_path)
+
+        manager.project_root = other
+        assert not manager.has_pyproject_deps
+
     def test_create_deps_manager_factory(self, tmp_path: Path) -> None:
         """Test the create_deps_manager factory function."""
         (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
@@ -170,3 +204,266 @@ class TestDepsManager:
             assert manager.verbose is True
         finally:
             os.chdir(original_cwd)
+
+    def test_create_deps_manager_from_config(self, tmp_path: Path) -> None:
+        """The config's venv and deps settings, installer included, reach the manager."""
+        config = DevflowConfig.from_dict(
+            {
+                "venv_dir": "env",
+                "deps": {"installer": "uv", "freeze_output": "locked.txt"},
+            }
+        )
+
+        manager = create_deps_manager_from_config(config, project_root=tmp_path, quiet=True)
+
+        assert manager.installer == "uv"
+        assert manager.venv_dir_name == "env"
+        assert manager.freeze_output == "locked.txt"
+        assert manager.quiet is True
+
+
+class TestDepsSyncBatching:
+    """Tests for how sync groups install sources into pip invocations."""
+
+    @pytest.fixture
+    def req_project(self, tmp_path: Path) -> Path:
+        """Create a project with pyproject dependencies and two requirements files."""
+        (tmp_path / "pyproject.toml").write_text(
+            "[project]\nname = 'test'\ndependencies = ['requests']\n"
+        )
+        (tmp_path / "requirements.txt").write_text("requests\n")
+        (tmp_path / "requirements-dev.txt").write_text("pytest\n")
+        return tmp_path
+
+    def _sync(self, project: Path, **kwargs) -> list[list[str]]:
+        manager = DepsManager(project_root=project, quiet=True, **kwargs)
+        ok = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+        with patch.object(DepsManager, "_ensure_venv", return_value=True), patch.object(
+            DepsManager, "_run_pip", return_value=ok
+        ) as mock_pip:
+            assert manager.sync(upgrade=True) == 0
+        return [call.args[0] for call in mock_pip.call_args_list]
+
+    def test_sync_uses_single_pip_run(self, req_project: Path) -> None:
+        """All sources are installed by one pip invocation by default."""
+        root = str(req_project.resolve())
+        assert self._sync(req_project) == [
+            [
+                "install",
+                "-e", root,
+                "-r", str(req_project.resolve() / "requirements.txt"),
+                "-r", str(req_project.resolve() / "requirements-dev.txt"),
+                "--upgrade",
+            ]
+        ]
+
+    @pytest.mark.parametrize(
+        ("verbose", "stream_stdout", "stdout", "stderr"),
+        [
+            (False, False, subprocess.DEVNULL, subprocess.PIPE),
+            (False, True, None, subprocess.PIPE),
+            (True, False, None, None),
+        ],
+    )
+    def test_run_pip_does_not_buffer_stdout(
+        self, tmp_path: Path, verbose: bool, stream_stdout: bool, stdout, stderr
+    ) -> None:
+        """Test that pip's stdout is never captured into memory."""
+        manager = DepsManager(project_root=tmp_path, verbose=verbose, quiet=True)
+        ok = subprocess.CompletedProcess(args=[], returncode=0)
+
+        with patch("subprocess.run", return_value=ok) as mock_run:
+            manager._run_pip(["list"], stream_stdout=stream_stdout)
+
+        kwargs = mock_run.call_args.kwargs
+        assert kwargs["stdout"] == stdout
+        assert kwargs["stderr"] == stderr
+        assert "capture_output" not in kwargs
+
+    @pytest.mark.parametrize(
+        ("installer", "uv_path", "prefix"),
+        [
+            ("uv", "/usr/bin/uv", ["/usr/bin/uv", "pip", "list"]),
+            ("uv", None, ["-m", "pip", "list"]),
+            ("pip", "/usr/bin/uv", ["-m", "pip", "list"]),
+        ],
+    )
+    def test_run_pip_installer(
+        self, tmp_path: Path, installer: str, uv_path: str | None, prefix: list[str]
+    ) -> None:
+        """Test that installer="uv" runs uv pip when uv is available."""
+        manager = DepsManager(project_root=tmp_path, installer=installer, quiet=True)
+        ok = subprocess.CompletedProcess(args=[], returncode=0)
+
+        with patch("shutil.which", return_value=uv_path), patch(
+            "subprocess.run", return_value=ok
+        ) as mock_run:
+            manager._run_pip(["list"])
+
+        cmd = mock_run.call_args.args[0]
+        if uv_path and installer == "uv":
+            assert cmd == [*prefix, "--python", str(manager.venv_python)]
+        else:
+            assert cmd == [str(manager.venv_python), *prefix]
+
+    def test_sync_unbatched_runs_pip_per_source(self, req_project: Path) -> None:
+        """With batch_installs=False each source gets its own pip run."""
+        calls = self._sync(req_project, batch_installs=False)
+        assert [call[1:3] for call in calls] == [
+            ["-e", str(req_project.resolve())],
+            ["-r", str(req_project.resolve() / "requirements.txt")],
+            ["-r", str(req_project.resolve() / "requirements-dev.txt")],
+        ]
+        assert all(call[-1] == "--upgrade" for call in calls)
+
+
+class TestDepsSyncSkipUnchanged:
+    """Tests for skipping pip when nothing changed since the last sync."""
+
+    @pytest.fixture
+    def synced_project(self, tmp_path: Path) -> Path:
+        """Create a project with a requirements file and a venv-shaped directory."""
+        site_packages = (
+            tmp_path / ".venv" / "Lib" / "site-packages"
+            if os.name == "nt"
+            else tmp_path / ".venv" / "lib" / "python3.11" / "site-packages"
+        )
+        site_packages.mkdir(parents=True)
+        (tmp_path / "requirements.txt").write_text("requests\n")
+        return tmp_path
+
+    def _pip_runs(self, project: Path, **kwargs) -> int:
+        manager = DepsManager(project_root=project, quiet=True)
+        ok = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+        with patch.object(DepsManager, "_ensure_venv", return_value=True), patch.object(
+            DepsManager, "_run_pip", return_value=ok
+        ) as mock_pip:
+            assert manager.sync(include_dev=False, **kwargs) == 0
+        return mock_pip.call_count
+
+    def test_second_sync_skips_pip(self, synced_project: Path) -> None:
+        """An unchanged project is not reinstalled, unless upgrading."""
+        assert self._pip_runs(synced_project) == 1
+        assert self._pip_runs(synced_project) == 0
+        assert self._pip_runs(synced_project, upgrade=True) == 1
+
+    def test_changed_requirements_rerun_pip(self, synced_project: Path) -> None:
+        """Editing a requirements file invalidates the last sync."""
+        assert self._pip_runs(synced_project) == 1
+        (synced_project / "requirements.txt").write_text("requests\nrich\n")
+        assert self._pip_runs(synced_project) == 1
+
+    def test_touched_but_unchanged_requirements_skip_pip(self, synced_project: Path) -> None:
+        """Only requirement contents count, not their mtimes."""
+        assert self._pip_runs(synced_project) == 1
+        requirements = synced_project / "requirements.txt"
+        os.utime(requirements, ns=(0, 0))
+        assert self._pip_runs(synced_project) == 0
+
+    def test_failed_sync_is_not_recorded(self, synced_project: Path) -> None:
+        """A failed install leaves no stamp, so the next sync runs pip."""
+        manager = DepsManager(project_root=synced_project, quiet=True)
+        failed = subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="")
+        with patch.object(DepsManager, "_ensure_venv", return_value=True), patch.object(
+            DepsManager, "_run_pip", return_value=failed
+        ):
+            assert manager.sync(include_dev=False) == 1
+
+        assert self._pip_runs(synced_project) == 1
+
+
+class TestDepsFreezeMetadata:
+    """Tests for freezing from installed distribution metadata."""
+
+    @pytest.fixture
+    def fake_venv(self, tmp_path: Path) -> Path:
+        """Create a venv-shaped directory with hand-written dist-info entries."""
+        venv = tmp_path / ".venv"
+        python = venv / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
+        python.parent.mkdir(parents=True)
+        python.touch()
+        site_packages = (
+            venv / "Lib" / "site-packages"
+            if os.name == "nt"
+            else venv / "lib" / "python3.11" / "site-packages"
+        )
+
+        def add_dist(name: str, version: str, direct_url: str | None = None) -> None:
+            dist_info = site_packages / f"{name}-{version}.dist-info"
+            dist_info.mkdir(parents=True)
+            (dist_info / "METADATA").write_text(
+                f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+            )
+            if direct_url is not None:
+                (dist_info / "direct_url.json").write_text(direct_url)
+
+        add_dist("Requests", "2.31.0")
+        add_dist("pip", "23.2.1")
+        add_dist("demo", "0.1", '{"url": "file:///src/demo", "dir_info": {"editable": true}}')
+        add_dist(
+            "lib",
+            "1.0",
+            '{"url": "https://example.com/lib.git", '
+            '"vcs_info": {"vcs": "git", "commit_id": "abc123"}}',
+        )
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
+        return tmp_path
+
+    def test_freeze_reads_metadata_without_pip(self, fake_venv: Path) -> None:
+        """Test that freeze lists distributions without running pip."""
+        manager = DepsManager(project_root=fake_venv, quiet=True)
+
+        with patch("subprocess.run") as mock_run:
+            assert manager.freeze() == 0
+
+        mock_run.assert_not_called()
+        lines = (fake_venv / "requirements-freeze.txt").read_text().splitlines()
+        assert [line for line in lines if not line.startswith("#")] == [
+            "-e file:///src/demo",
+            "lib @ git+https://example.com/lib.git@abc123",
+            "Requests==2.31.0",
+        ]
+
+    def test_freeze_falls_back_to_pip_with_system_site_packages(
+        self, fake_venv: Path
+    ) -> None:
+        """Test that venvs seeing system site-packages are frozen with pip."""
+        (fake_venv / ".venv" / "pyvenv.cfg").write_text(
+            "include-system-site-packages = true\n"
+        )
+        manager = DepsManager(project_root=fake_venv, quiet=True)
+        pip_output = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="Requests==2.31.0\n", stderr=""
+        )
+
+        with patch("subprocess.run", return_value=pip_output) as mock_run:
+            assert manager.freeze() == 0
+
+        assert mock_run.call_args.args[0][-2:] == ["pip", "freeze"]
+
+    def test_unchanged_freeze_file_is_not_rewritten(self, fake_venv: Path) -> None:
+        """Test that freezing identical contents leaves the file's mtime alone."""
+        manager = DepsManager(project_root=fake_venv, quiet=True)
+        output = fake_venv / "requirements-freeze.txt"
+
+        assert manager.freeze() == 0
+        os.utime(output, ns=(0, 0))
+        assert manager.freeze() == 0
+        assert output.stat().st_mtime_ns == 0
+
+        assert manager.freeze(include_all=True) == 0
+        assert output.stat().st_mtime_ns != 0
+        assert "pip==23.2.1" in output.read_text()
+
+    def test_legacy_freeze_normalizes_pip_output(self, fake_venv: Path) -> None:
+        """Test that pip freeze output is stripped, filtered and sorted."""
+        manager = DepsManager(project_root=fake_venv, quiet=True)
+        pip_output = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="zope==1\n\n  Attrs==2  \r\npip==23\n", stderr=""
+        )
+
+        with patch("subprocess.run", return_value=pip_output):
+            assert manager.freeze(legacy=True) == 0
+
+        lines = (fake_venv / "requirements-freeze.txt").read_text().splitlines()
+        assert [line for line in lines if not line.startswith("#")] == ["Attrs==2", "zope==1"]
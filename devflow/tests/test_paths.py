@@ -14,6 +14,7 @@ from devflow.core.paths import (
     get_venv_env,
     get_venv_pip,
     get_venv_python,
+    get_venv_site_packages,
     has_pyproject_dependencies,
     is_venv_active,
     resolve_requirements_files,
@@ -93,6 +94,20 @@ class TestPathHelpers:
         venv_dir = tmp_path / ".venv"
         assert not venv_exists(venv_dir)
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX venv layout")
+    def test_get_venv_site_packages(self, tmp_path: Path) -> None:
+        """Test finding site-packages, ignoring ambiguous or missing layouts."""
+        venv_dir = tmp_path / ".venv"
+        assert get_venv_site_packages(venv_dir) is None
+
+        site_packages = venv_dir / "lib" / "python3.11" / "site-packages"
+        site_packages.mkdir(parents=True)
+        (venv_dir / "lib" / "pkgconfig").mkdir()
+        assert get_venv_site_packages(venv_dir) == site_packages
+
+        (venv_dir / "lib" / "python3.12" / "site-packages").mkdir(parents=True)
+        assert get_venv_site_packages(venv_dir) is None
+
     def test_is_venv_active_false(self, tmp_path: Path) -> None:
         """Test is_venv_active returns False when not active."""
         venv_dir = tmp_path / ".venv"
@@ -5,7 +5,9 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
-from devflow.commands.venv import VenvManager, create_venv_manager
+import pytest
+
+from devflow.commands.venv import VenvManager, _remove_tree, create_venv_manager
 from devflow.core.paths import get_venv_python, venv_exists
 
 
@@ -120,6 +122,37 @@ class TestVenvManager:
         assert result == 0
         assert not manager.venv_dir.exists()
 
+    def test_remove_tree_does_not_follow_symlinks(self, tmp_path: Path) -> None:
+        """Test that _remove_tree deletes nested files but not symlink targets."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+
+        tree = tmp_path / "tree"
+        (tree / "lib" / "pkg").mkdir(parents=True)
+        (tree / "lib" / "pkg" / "module.py").write_text("")
+        (tree / "top.txt").write_text("")
+        (tree / "link").symlink_to(outside, target_is_directory=True)
+
+        _remove_tree(tree)
+
+        assert not tree.exists()
+        assert (outside / "keep.txt").read_text() == "keep"
+
+    def test_remove_tree_refuses_symlinked_root(self, tmp_path: Path) -> None:
+        """Test that _remove_tree leaves a symlinked root and its target alone."""
+        target = tmp_path / "target"
+        target.mkdir()
+        (target / "keep.txt").write_text("keep")
+        link = tmp_path / "link"
+        link.symlink_to(target, target_is_directory=True)
+
+        with pytest.raises(OSError):
+            _remove_tree(link)
+
+        assert link.is_symlink()
+        assert (target / "keep.txt").read_text() == "keep"
+
     def test_venv_delete_nonexistent(self, tmp_path: Path) -> None:
         """Test that venv delete succeeds even if venv doesn't exist."""
         (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
@@ -132,6 +165,17 @@ class TestVenvManager:
         result = manager.delete()
         assert result == 0
 
+    def test_venv_dir_cached_until_name_changes(self, tmp_path: Path) -> None:
+        """Test that venv_dir is resolved once and refreshed on rename."""
+        manager = VenvManager(project_root=tmp_path, venv_dir_name=".venv")
+
+        first = manager.venv_dir
+        assert manager.venv_dir is first
+        assert first == (tmp_path / ".venv").resolve()
+
+        manager.venv_dir_name = "env"
+        assert manager.venv_dir == (tmp_path / "env").resolve()
+
     def test_create_venv_manager_factory(self, tmp_path: Path) -> None:
         """Test the create_venv_manager factory function."""
         (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
@@ -0,0 +1,19 @@
+"""Shared pytest fixtures for the devflow test suite."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def isolated_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Point the devflow cache directory at a temporary location.
+
+    Keeps the test suite from reading or writing the user's real cache.
+    """
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+    yield
+    monkeypatch.undo()
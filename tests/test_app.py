@@ -11,6 +11,7 @@ from devflow.app import (
     VERBOSITY_QUIET,
     VERBOSITY_VERBOSE,
     AppContext,
+    FastLogger,
     setup_logging,
 )
 from devflow.config import DEFAULT_CONFIG
@@ -45,6 +46,21 @@ class TestSetupLogging:
         assert len(logger.handlers) == 1
         assert isinstance(logger.handlers[0], logging.StreamHandler)
 
+    def test_repeated_setup_reuses_handler(self) -> None:
+        """Repeated setup should not stack or rebuild handlers."""
+        first = setup_logging(VERBOSITY_DEFAULT).handlers[0]
+        logger = setup_logging(VERBOSITY_DEBUG)
+
+        assert logger.handlers == [first]
+        assert logger.level == logging.DEBUG
+
+    def test_handler_follows_stderr(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Handler should write to the current sys.stderr."""
+        logger = setup_logging(VERBOSITY_DEFAULT)
+        logger.info("hello stderr")
+
+        assert "hello stderr" in capsys.readouterr().err
+
 
 class TestAppContext:
     """Tests for AppContext creation and methods."""
@@ -96,33 +112,33 @@ venv_dir = ".custom-venv"
         with pytest.raises(FileNotFoundError):
             AppContext.create(project_root=nonexistent)
 
-    def test_log_methods(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
-        """Should log messages with appropriate levels."""
+    def test_log_methods(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Should write messages of every level to stderr."""
         (tmp_path / "pyproject.toml").write_text("[project]\n")
         ctx = AppContext.create(project_root=tmp_path, verbosity=VERBOSITY_DEBUG)
 
-        with caplog.at_level(logging.DEBUG, logger="devflow"):
-            ctx.log("Info message")
-            ctx.debug("Debug message")
-            ctx.warning("Warning message")
-            ctx.error("Error message")
+        ctx.log("Info message")
+        ctx.debug("Debug message")
+        ctx.warning("Warning message")
+        ctx.error("Error message")
 
-        assert "Info message" in caplog.text
-        assert "Debug message" in caplog.text
-        assert "Warning message" in caplog.text
-        assert "Error message" in caplog.text
+        err = capsys.readouterr().err
+        assert "INFO [devflow] Info message" in err
+        assert "DEBUG [devflow] Debug message" in err
+        assert "WARNING [devflow] Warning message" in err
+        assert "ERROR [devflow] Error message" in err
 
-    def test_log_with_phase(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    def test_log_with_phase(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
         """Should include phase prefix in log messages."""
         (tmp_path / "pyproject.toml").write_text("[project]\n")
         ctx = AppContext.create(project_root=tmp_path, verbosity=VERBOSITY_DEBUG)
 
-        with caplog.at_level(logging.DEBUG, logger="devflow"):
-            ctx.log("Running tests", phase="test")
-            ctx.debug("Test details", phase="test")
+        ctx.log("Running tests", phase="test")
+        ctx.debug("Test details", phase="test")
 
-        assert "[test] Running tests" in caplog.text
-        assert "[test] Test details" in caplog.text
+        err = capsys.readouterr().err
+        assert "[test] Running tests" in err
+        assert "[test] Test details" in err
 
     def test_fallback_to_current_dir_when_no_root_markers(
         self, tmp_path: Path, caplog: pytest.LogCaptureFixture
@@ -152,3 +168,85 @@ class TestAppContextDefaults:
         assert ctx.config.venv_dir == DEFAULT_CONFIG.venv_dir
         assert ctx.config.default_python == DEFAULT_CONFIG.default_python
         assert ctx.config.test_runner == DEFAULT_CONFIG.test_runner
+
+
+class TestAppContextImmutability:
+    """Tests for the frozen AppContext dataclass."""
+
+    def test_context_is_frozen(self, tmp_path: Path) -> None:
+        """Should reject attribute assignment after creation."""
+        import dataclasses
+
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+        ctx = AppContext.create(project_root=tmp_path)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            ctx.dry_run = True  # type: ignore[misc]
+
+    def test_replace_derives_new_context(self, tmp_path: Path) -> None:
+        """Should support deriving a modified copy."""
+        import dataclasses
+
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+        ctx = AppContext.create(project_root=tmp_path)
+
+        dry = dataclasses.replace(ctx, dry_run=True)
+
+        assert dry.dry_run is True
+        assert ctx.dry_run is False
+        assert dry.project_root == ctx.project_root
+
+
+class TestAppContextLogging:
+    """Tests for AppContext logging helpers."""
+
+    def test_debug_suppressed_at_default_verbosity(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Debug messages should be dropped at default verbosity."""
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+        ctx = AppContext.create(project_root=tmp_path)
+
+        ctx.debug("hidden detail", phase="test")
+        ctx.log("visible", phase="test")
+
+        err = capsys.readouterr().err
+        assert "hidden detail" not in err
+        assert "[test] visible" in err
+
+    def test_percent_in_message_is_preserved(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Literal percent signs should not be treated as format specifiers."""
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+        ctx = AppContext.create(project_root=tmp_path)
+
+        ctx.log("coverage 100%s", phase="test")
+        ctx.log("50% done")
+
+        err = capsys.readouterr().err
+        assert "[test] coverage 100%s" in err
+        assert "50% done" in err
+
+    def test_fast_logger_below_debug(self, tmp_path: Path) -> None:
+        """Should use the lightweight writer unless debug output is requested."""
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+
+        quiet = AppContext.create(project_root=tmp_path, verbosity=VERBOSITY_QUIET)
+        verbose = AppContext.create(project_root=tmp_path, verbosity=VERBOSITY_VERBOSE)
+        debug = AppContext.create(project_root=tmp_path, verbosity=VERBOSITY_DEBUG)
+
+        assert isinstance(quiet.logger, FastLogger)
+        assert quiet.logger.level == logging.WARNING
+        assert isinstance(verbose.logger, FastLogger)
+        assert verbose.logger.isEnabledFor(logging.DEBUG)
+        assert isinstance(debug.logger, logging.Logger)
+
+    def test_fast_logger_debug_toggle(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Debug calls should only write when the level allows it."""
+        FastLogger(logging.INFO).debug("dropped %s", "value")
+        FastLogger(logging.DEBUG).debug("kept %s", "value")
+
+        err = capsys.readouterr().err
+        assert "dropped" not in err
+        assert "kept value" in err
@@ -118,6 +118,9 @@ class TestCommandRegistry:
         with pytest.raises(ValueError, match="already registered"):
             registry.register(TestCmd2)
 
+        assert registry.get("duplicate") is TestCmd1
+        assert registry.list_commands() == ["duplicate"]
+
     def test_get_nonexistent_returns_none(self):
         """Getting a non-existent command returns None."""
         registry = CommandRegistry()
@@ -176,6 +179,32 @@ class TestCommandRegistry:
 
         assert registry.list_commands() == ["alpha", "beta", "charlie"]
 
+    def test_list_commands_tracks_unregister(self):
+        """list_commands stays sorted and current after unregistering."""
+
+        class CmdA(Command):
+            name = "alpha"
+            help = "Alpha"
+
+            def run(self, **kwargs):
+                return 0
+
+        class CmdB(Command):
+            name = "beta"
+            help = "Beta"
+
+            def run(self, **kwargs):
+                return 0
+
+        registry = CommandRegistry()
+        registry.register(CmdB)
+        registry.register(CmdA)
+        listed = registry.list_commands()
+        listed.append("mutated")
+        registry.unregister("alpha")
+
+        assert registry.list_commands() == ["beta"]
+
     def test_contains(self):
         """The 'in' operator works correctly."""
 
@@ -190,3 +219,70 @@ class TestCommandRegistry:
         assert "exists" not in registry
         registry.register(TestCmd)
         assert "exists" in registry
+
+    def test_register_lazy_defers_loading(self):
+        """Lazy commands are listed without importing until first lookup."""
+
+        class LazyCmd(Command):
+            name = "lazy"
+            help = "Lazy command"
+
+            def run(self, **kwargs):
+                return 0
+
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return LazyCmd
+
+        registry = CommandRegistry()
+        registry.register_lazy("lazy", "Lazy command", loader)
+
+        assert "lazy" in registry
+        assert registry.list_commands() == ["lazy"]
+        assert registry.get_help("lazy") == "Lazy command"
+        assert calls == []
+
+        assert registry.get("lazy") is LazyCmd
+        assert registry.get("lazy") is LazyCmd
+        assert calls == [1]
+
+    def test_register_lazy_duplicate_raises(self):
+        """A lazy registration cannot shadow an existing command."""
+
+        class TestCmd(Command):
+            name = "taken"
+            help = "Taken"
+
+            def run(self, **kwargs):
+                return 0
+
+        registry = CommandRegistry()
+        registry.register(TestCmd)
+
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register_lazy("taken", "Other", lambda: TestCmd)
+
+    def test_freeze_blocks_modification(self):
+        """A frozen registry rejects (un)registration but still resolves."""
+
+        class TestCmd(Command):
+            name = "fixed"
+            help = "Fixed"
+
+            def run(self, **kwargs):
+                return 0
+
+        registry = CommandRegistry()
+        registry.register_lazy("fixed", "Fixed", lambda: TestCmd)
+        registry.freeze()
+
+        with pytest.raises(RuntimeError, match="frozen"):
+            registry.register(TestCmd)
+        with pytest.raises(RuntimeError, match="frozen"):
+            registry.unregister("fixed")
+
+        assert registry.get("fixed") is TestCmd
+        assert registry.names == ("fixed",)
+        assert registry.names is registry.names
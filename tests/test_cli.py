@@ -1,12 +1,15 @@
 """Tests for CLI interface."""
 
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 from typer.testing import CliRunner
 
 from devflow import __version__
-from devflow.cli import app
+from devflow.cli import _COMMAND_TABLE, _get_app, _sniff_subcommand, app
 
 runner = CliRunner()
 
@@ -21,6 +24,73 @@ class TestCLIVersion:
         assert result.exit_code == 0
         assert __version__ in result.stdout
 
+    def test_short_version_flag(self) -> None:
+        """Should accept -V as an alias for --version."""
+        result = runner.invoke(app, ["-V"])
+
+        assert result.exit_code == 0
+        assert __version__ in result.stdout
+
+
+class TestCLILazyImports:
+    """Tests for deferred imports in the CLI module."""
+
+    def test_import_does_not_load_typer(self) -> None:
+        """Importing devflow.cli should not import Typer or the app layer."""
+        code = (
+            "import sys, devflow.cli; "
+            "print('typer' in sys.modules, 'devflow.app' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False False"
+
+    @pytest.mark.parametrize("flag", ["--version", "-V"])
+    def test_version_fast_path_does_not_load_typer(self, flag: str) -> None:
+        """A bare --version or -V should be answered without importing Typer."""
+        code = (
+            "import sys, devflow.cli\n"
+            f"sys.argv = ['devflow', '{flag}']\n"
+            "devflow.cli.cli()\n"
+            "print('typer' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.splitlines() == [f"devflow version {__version__}", "False"]
+
+    def test_building_app_does_not_import_command_modules(self) -> None:
+        """Building every command should not import the command implementations."""
+        code = (
+            "import sys, devflow.cli; devflow.cli._get_app(); "
+            "print(sorted(m for m in sys.modules if m.startswith('devflow.commands.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_subcommand_help_does_not_import_app_layer(self) -> None:
+        """Subcommand --help should not import config loading or the app layer."""
+        code = (
+            "import sys, devflow.cli\n"
+            "sys.argv = ['devflow', 'test', '--help']\n"
+            "try:\n"
+            "    devflow.cli.cli()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('devflow.app' in sys.modules, 'devflow.config.loader' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "False False"
+
 
 def strip_ansi(text: str) -> str:
     """Strip ANSI escape codes from text."""
@@ -48,7 +118,7 @@ class TestCLIHelp:
         """Should show available commands when no args provided."""
         (tmp_path / "pyproject.toml").write_text("[project]\n")
 
-        with patch("devflow.cli.Path.cwd", return_value=tmp_path):
+        with patch("pathlib.Path.cwd", return_value=tmp_path):
             result = runner.invoke(app, [], env={"PWD": str(tmp_path)})
 
         # Should show available commands
@@ -152,6 +222,30 @@ class TestCLISubcommands:
         assert result.exit_code == 0
 
 
+class TestCLICompletion:
+    """Tests for shell completion support."""
+
+    def test_help_omits_completion_install_options(self) -> None:
+        """Completion options should not be built on every invocation."""
+        result = runner.invoke(app, ["--help"])
+
+        assert "--install-completion" not in strip_ansi(result.stdout)
+
+    def test_completion_script_for_bash(self) -> None:
+        """Should print a bash completion script for devflow."""
+        result = runner.invoke(app, ["completion", "bash"])
+
+        assert result.exit_code == 0
+        assert "_DEVFLOW_COMPLETE" in result.stdout
+        assert "devflow" in result.stdout
+
+    def test_completion_unsupported_shell(self) -> None:
+        """Should fail for shells without completion support."""
+        result = runner.invoke(app, ["completion", "tcsh"])
+
+        assert result.exit_code != 0
+
+
 class TestCLIErrorHandling:
     """Tests for CLI error handling."""
 
@@ -166,7 +260,8 @@ class TestCLIErrorHandling:
         )
 
         assert result.exit_code != 0
-        assert "not found" in result.stdout.lower() or "error" in result.stdout.lower()
+        # Errors are reported on stderr, not mixed into stdout
+        assert "config file not found" in result.stderr.lower()
 
     def test_invalid_project_root(self, tmp_path: Path) -> None:
         """Should show error for invalid project root."""
@@ -175,3 +270,101 @@ class TestCLIErrorHandling:
         result = runner.invoke(app, ["--project-root", str(nonexistent), "test"])
 
         assert result.exit_code != 0
+
+
+class TestCLILazyContext:
+    """Tests for deferred AppContext creation."""
+
+    def test_subcommand_help_skips_context(self, tmp_path: Path) -> None:
+        """Subcommand --help should not resolve the project or load config."""
+        nonexistent = tmp_path / "nonexistent"
+
+        with patch("devflow.app.AppContext.create") as create:
+            result = runner.invoke(app, ["--project-root", str(nonexistent), "test", "--help"])
+
+        assert result.exit_code == 0
+        create.assert_not_called()
+
+    def test_context_is_isolated_per_execution_context(self, tmp_path: Path) -> None:
+        """A fresh execution context should not see another invocation's context."""
+        import contextvars
+
+        from devflow.cli import get_context
+
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+        runner.invoke(app, ["--project-root", str(tmp_path), "test"])
+
+        with pytest.raises(RuntimeError, match="not initialized"):
+            contextvars.Context().run(get_context)
+
+    def test_version_skips_context(self) -> None:
+        """--version should not resolve the project or load config."""
+        with patch("devflow.app.AppContext.create") as create:
+            result = runner.invoke(app, ["--version"])
+
+        assert result.exit_code == 0
+        create.assert_not_called()
+
+
+class TestSubcommandSniffing:
+    """Tests for selective subcommand registration."""
+
+    def test_sniff_plain_subcommand(self) -> None:
+        """Should return the first positional token."""
+        assert _sniff_subcommand(["test", "-k", "foo"]) == "test"
+
+    def test_sniff_skips_global_flags(self) -> None:
+        """Should skip global flags and option values."""
+        argv = ["-vv", "--dry-run", "--config", "custom.toml", "-p", "/tmp", "build"]
+
+        assert _sniff_subcommand(argv) == "build"
+
+    def test_sniff_inline_option_value(self) -> None:
+        """Should handle --option=value forms."""
+        assert _sniff_subcommand(["--config=custom.toml", "deps", "sync"]) == "deps"
+
+    def test_sniff_no_subcommand(self) -> None:
+        """Should return None for bare flags or no arguments."""
+        assert _sniff_subcommand([]) is None
+        assert _sniff_subcommand(["--help"]) is None
+        assert _sniff_subcommand(["--version"]) is None
+
+    def test_sniff_unknown_command(self) -> None:
+        """Should return None for unknown commands so Click reports them."""
+        assert _sniff_subcommand(["bogus"]) is None
+
+    def test_app_registers_only_sniffed_command(self) -> None:
+        """Should only build the requested subcommand."""
+        import typer
+
+        group = typer.main.get_command(_get_app("test"))
+
+        assert list(group.commands) == ["test"]
+
+    def test_app_registers_all_commands_by_default(self) -> None:
+        """Should register every command when none is sniffed."""
+        import typer
+
+        group = typer.main.get_command(_get_app())
+
+        assert set(group.commands) == set(_COMMAND_TABLE)
+
+
+class TestEntryPoint:
+    """Tests for the packaged console script."""
+
+    def test_single_console_script_targets_cli(self) -> None:
+        """pyproject.toml should declare one devflow script pointing at cli()."""
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib
+
+        import devflow.cli
+
+        pyproject = Path(__file__).resolve().parent.parent / "pyproject.toml"
+        with open(pyproject, "rb") as f:
+            data = tomllib.load(f)
+
+        assert data["project"]["scripts"] == {"devflow": "devflow.cli:cli"}
+        assert callable(devflow.cli.cli)
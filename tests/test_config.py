@@ -1,6 +1,8 @@
 """Tests for configuration loading and schema."""
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -47,6 +49,7 @@ class TestDevflowConfigSchema:
         assert config.deps.requirements == "requirements.txt"
         assert config.deps.dev_requirements == "requirements-dev.txt"
         assert config.deps.freeze_output == "requirements-freeze.txt"
+        assert config.deps.installer == "pip"
 
     def test_from_dict_basic(self) -> None:
         """Should create config from dictionary."""
@@ -113,6 +116,17 @@ class TestDevflowConfigSchema:
 
         assert config.tasks["ci"].pipeline == ["lint", "test"]
 
+    def test_config_is_frozen(self) -> None:
+        """Config objects should reject attribute assignment."""
+        import dataclasses
+
+        config = DevflowConfig()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.venv_dir = ".other"  # type: ignore[misc]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.paths.dist_dir = "out"  # type: ignore[misc]
+
 
 class TestConfigMerging:
     """Tests for configuration merging behavior."""
@@ -144,6 +158,14 @@ class TestConfigMerging:
         assert merged.publish.sign is True
         assert merged.publish.repository == "pypi"  # preserved from base
 
+    def test_merge_preserves_deps_installer(self) -> None:
+        """Should carry the deps installer through later merges."""
+        merged = DevflowConfig().merge_with({"deps": {"installer": "uv"}})
+        merged = merged.merge_with({"venv_dir": "env"})
+
+        assert merged.deps.installer == "uv"
+        assert merged.deps.requirements == "requirements.txt"
+
     def test_merge_does_not_modify_original(self) -> None:
         """Merging should not modify the original config."""
         base = DevflowConfig()
@@ -287,6 +309,67 @@ venv_dir = ".pyproject-venv"
         assert config.default_python == DEFAULT_CONFIG.default_python
 
 
+class TestConfigCache:
+    """Tests for cached configuration loading."""
+
+    def test_repeat_load_is_memoized(self, tmp_path: Path) -> None:
+        """Should return the cached config for unchanged files."""
+        (tmp_path / "pyproject.toml").write_text("[tool.devflow]\nvenv_dir = '.a'\n")
+
+        first = load_config(tmp_path)
+        with patch("devflow.config.loader._load_config_uncached") as mock_load:
+            second = load_config(tmp_path)
+
+        assert second is first
+        mock_load.assert_not_called()
+
+    def test_modified_file_invalidates_cache(self, tmp_path: Path) -> None:
+        """Should reparse when a config file changes."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("[tool.devflow]\nvenv_dir = '.a'\n")
+        assert load_config(tmp_path).venv_dir == ".a"
+
+        pyproject.write_text("[tool.devflow]\nvenv_dir = '.bb'\n")
+        stat_result = pyproject.stat()
+        os.utime(pyproject, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+
+        assert load_config(tmp_path).venv_dir == ".bb"
+
+    def test_new_file_invalidates_cache(self, tmp_path: Path) -> None:
+        """Should reparse when a new candidate config file appears."""
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
+        assert load_config(tmp_path).venv_dir == DEFAULT_CONFIG.venv_dir
+
+        (tmp_path / "devflow.toml").write_text("venv_dir = '.from-devflow'\n")
+
+        assert load_config(tmp_path).venv_dir == ".from-devflow"
+
+    def test_disk_cache_used_across_processes(self, tmp_path: Path) -> None:
+        """Should load the pickled config when the in-memory cache is empty."""
+        (tmp_path / "devflow.toml").write_text("venv_dir = '.disk'\n")
+        load_config(tmp_path)
+
+        with patch.dict("devflow.config.loader._config_memo", clear=True):
+            with patch("devflow.config.loader._load_config_uncached") as mock_load:
+                config = load_config(tmp_path)
+
+        assert config.venv_dir == ".disk"
+        mock_load.assert_not_called()
+
+    def test_use_cache_false_always_parses(self, tmp_path: Path) -> None:
+        """Should bypass both caches when use_cache is False."""
+        (tmp_path / "devflow.toml").write_text("venv_dir = '.nocache'\n")
+        load_config(tmp_path)
+
+        with patch(
+            "devflow.config.loader._load_config_uncached", return_value=DEFAULT_CONFIG
+        ) as mock_load:
+            config = load_config(tmp_path, use_cache=False)
+
+        assert config is DEFAULT_CONFIG
+        mock_load.assert_called_once()
+
+
 class TestFindConfigFile:
     """Tests for config file discovery."""
 
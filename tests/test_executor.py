@@ -4,12 +4,16 @@ Ownership: Workstream B (task/registry)
 """
 
 import os
+import subprocess
+import sys
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from devflow.commands.executor import (
+    MAX_OUTPUT_LINES,
     CycleDetectedError,
     ExecutionResult,
     PipelineResult,
@@ -90,6 +94,28 @@ class TestPipelineExpansion:
         assert expanded[0] == task1
         assert expanded[1] == inline_task
 
+    def test_expansion_reused_across_calls(self):
+        """Shared sub-pipelines are expanded once and callers get fresh lists."""
+        lint = Task(name="lint", command="ruff")
+        executor = TaskExecutor(
+            task_definitions={
+                "lint": lint,
+                "checks": Pipeline(name="checks", steps=["lint"]),
+                "ci": Pipeline(name="ci", steps=["checks", "checks"]),
+            }
+        )
+
+        with patch.object(
+            executor, "task_definitions", wraps=executor.task_definitions
+        ) as definitions:
+            first = executor.expand_pipeline("ci")
+            first.append(lint)
+            assert executor.expand_pipeline("ci") == [lint, lint]
+
+        # The second "checks" step and the second call come from the cache
+        looked_up = [call.args[0] for call in definitions.get.call_args_list]
+        assert looked_up == ["ci", "checks", "lint", "checks", "ci"]
+
     def test_cycle_detection_simple(self):
         """Simple cycle (A -> A) is detected."""
         pipeline = Pipeline(name="loop", steps=["loop"])
@@ -129,6 +155,25 @@ class TestPipelineExpansion:
         cycle_path = exc_info.value.cycle_path
         assert len(cycle_path) >= 3
 
+    def test_cycle_path_reported_in_order(self):
+        """The reported cycle lists the pipelines from the entry point back to the repeat."""
+        definitions = {
+            "a": Pipeline(name="a", steps=["lint", "b"]),
+            "b": Pipeline(name="b", steps=["c"]),
+            "c": Pipeline(name="c", steps=["lint", "b"]),
+            "lint": Task(name="lint", command="ruff"),
+        }
+        executor = TaskExecutor(task_definitions=definitions)
+
+        with pytest.raises(CycleDetectedError) as exc_info:
+            executor.expand_pipeline("a")
+
+        assert exc_info.value.cycle_path == ["a", "b", "c", "b"]
+
+        # A caller-supplied path is honoured too
+        with pytest.raises(CycleDetectedError):
+            TaskExecutor(task_definitions=definitions).expand_pipeline("c", path=["c"])
+
     def test_task_not_found(self):
         """TaskNotFoundError is raised for missing tasks."""
         executor = TaskExecutor(task_definitions={})
@@ -160,6 +205,14 @@ class TestPipelineExpansion:
 
         assert "test" in exc_info.value.available_tasks
 
+    def test_task_not_found_message_lists_sorted_names(self):
+        """The error message names the missing task and the sorted alternatives."""
+        error = TaskNotFoundError("missing", {"lint": None, "build": None})
+
+        assert error.available_tasks == ["build", "lint"]
+        assert str(error) == "Task 'missing' not found. Available tasks: build, lint"
+        assert str(TaskNotFoundError("missing")) == "Task 'missing' not found"
+
 
 class TestDryRunBehavior:
     """Tests for dry-run mode."""
@@ -193,6 +246,32 @@ class TestDryRunBehavior:
         assert isinstance(result, PipelineResult)
         assert all(r.skipped for r in result.results)
 
+    @patch("subprocess.run")
+    def test_dry_run_pipeline_preview(self, mock_run):
+        """A dry-run pipeline previews every step without running any."""
+        logged = []
+        task1 = Task(name="lint", command="ruff", args=["check"], use_venv=False)
+        task2 = Task(name="test", command="pytest", use_venv=False)
+        pipeline = Pipeline(name="ci", steps=["lint", "test"])
+        executor = TaskExecutor(
+            task_definitions={"lint": task1, "test": task2, "ci": pipeline},
+            dry_run=True,
+            log_callback=lambda phase, message, level: logged.append((phase, message)),
+        )
+
+        result = executor.run("ci")
+
+        mock_run.assert_not_called()
+        assert [r.task_name for r in result.results] == ["lint", "test"]
+        assert logged == [
+            ("ci", "Starting pipeline"),
+            ("ci", "Running step: lint"),
+            ("lint", "Would run: ruff check"),
+            ("ci", "Running step: test"),
+            ("test", "Would run: pytest"),
+            ("ci", "Pipeline completed successfully"),
+        ]
+
 
 class TestEnvPropagation:
     """Tests for environment variable propagation."""
@@ -219,6 +298,111 @@ class TestEnvPropagation:
             assert env["MY_VAR"] == "task_value"
             assert env["EXISTING_VAR"] == "overridden"
 
+    def test_env_built_once_per_overrides(self):
+        """Tasks with the same overrides share one merged environment."""
+        first = Task(name="a", command="echo", env={"MY_VAR": "1"})
+        second = Task(name="b", command="echo", env={"MY_VAR": "1"})
+        other = Task(name="c", command="echo", env={"MY_VAR": "2"})
+        executor = TaskExecutor(task_definitions={"a": first, "b": second, "c": other})
+
+        env = executor._build_env(first)
+        assert executor._build_env(second) is env
+        assert executor._build_env(other)["MY_VAR"] == "2"
+        assert env["MY_VAR"] == "1"
+
+    @patch("subprocess.run")
+    def test_no_env_overrides_inherits_environment(self, mock_run):
+        """Tasks without env overrides pass env=None instead of a copy."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=None, stderr=None)
+
+        task = Task(name="test", command="echo")
+        executor = TaskExecutor(task_definitions={"test": task})
+        executor.execute_task(task)
+
+        assert mock_run.call_args.kwargs["env"] is None
+
+    @patch("subprocess.run")
+    def test_env_overrides_passed_to_subprocess(self, mock_run):
+        """Tasks with env overrides pass the merged environment."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=None, stderr=None)
+
+        task = Task(name="test", command="echo", env={"MY_VAR": "1"})
+        executor = TaskExecutor(task_definitions={"test": task})
+        with patch.dict(os.environ, {"EXISTING_VAR": "value"}):
+            executor.execute_task(task)
+
+        env = mock_run.call_args.kwargs["env"]
+        assert env["MY_VAR"] == "1"
+        assert env["EXISTING_VAR"] == "value"
+
+
+class TestCommandResolution:
+    """Tests for resolving bare command names against PATH."""
+
+    @patch("subprocess.run")
+    @patch("shutil.which", return_value="/usr/bin/tool")
+    def test_resolution_cached_per_executor(self, mock_which, mock_run):
+        """Each bare command is looked up on PATH once per executor."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=None, stderr=None)
+        task = Task(name="t", command="tool", use_venv=False)
+        executor = TaskExecutor(task_definitions={"t": task})
+
+        executor.execute_task(task)
+        executor.execute_task(task)
+
+        mock_which.assert_called_once_with("tool")
+        assert mock_run.call_args.args[0] == ["/usr/bin/tool"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX venv layout")
+    def test_venv_lookup_cached_per_command(self, tmp_path):
+        """Each command is looked up in the venv once per executor."""
+        tool = tmp_path / "bin" / "tool"
+        tool.parent.mkdir()
+        tool.touch(mode=0o755)
+        task = Task(name="t", command="tool")
+        executor = TaskExecutor(task_definitions={"t": task}, venv_path=tmp_path)
+
+        assert executor._get_executable_path(task) == str(tool)
+        tool.unlink()
+        assert executor._get_executable_path(task) == str(tool)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX venv layout")
+    def test_venv_lookup_finds_executables_only(self, tmp_path):
+        """Only executable venv entries are used; python3 falls back to python."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        (bin_dir / "notes").touch(mode=0o644)
+        (bin_dir / "python").touch(mode=0o755)
+
+        assert TaskExecutor._find_in_venv(tmp_path, "notes") == "notes"
+        assert TaskExecutor._find_in_venv(tmp_path, "python3") == str(bin_dir / "python")
+
+    @patch("subprocess.run")
+    @patch("shutil.which", return_value="/custom/tool")
+    def test_task_path_override_is_not_cached(self, mock_which, mock_run):
+        """Tasks that override PATH resolve against it and bypass the cache."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=None, stderr=None)
+        task = Task(name="t", command="tool", use_venv=False, env={"PATH": "/custom"})
+        executor = TaskExecutor(task_definitions={"t": task})
+
+        executor.execute_task(task)
+
+        mock_which.assert_called_once_with("tool", path="/custom")
+        assert executor._which_cache == {}
+
+    @patch("subprocess.run")
+    @patch("shutil.which")
+    def test_commands_with_directory_are_not_resolved(self, mock_which, mock_run):
+        """Relative or absolute command paths are passed through untouched."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=None, stderr=None)
+        task = Task(name="t", command="./scripts/check.sh", use_venv=False)
+        executor = TaskExecutor(task_definitions={"t": task})
+
+        executor.execute_task(task)
+
+        mock_which.assert_not_called()
+        assert mock_run.call_args.args[0] == ["./scripts/check.sh"]
+
 
 class TestExitCodePropagation:
     """Tests for exit code propagation and short-circuiting."""
@@ -303,6 +487,242 @@ class TestExitCodePropagation:
         assert "not found" in result.error.lower()
 
 
+class TestOutputHandling:
+    """Tests for how child process output is routed at each verbosity."""
+
+    @pytest.mark.parametrize(
+        ("verbosity", "stdout", "stderr"),
+        [
+            (-1, subprocess.DEVNULL, subprocess.DEVNULL),
+            (0, None, subprocess.PIPE),
+            (1, None, None),
+        ],
+    )
+    @patch("subprocess.run")
+    def test_stdio_by_verbosity(self, mock_run, verbosity, stdout, stderr):
+        """Output is discarded, partly captured, or inherited by verbosity."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=None, stderr=None)
+
+        task = Task(name="test", command="echo")
+        executor = TaskExecutor(task_definitions={"test": task}, verbosity=verbosity)
+        executor.execute_task(task)
+
+        kwargs = mock_run.call_args.kwargs
+        assert kwargs["stdout"] == stdout
+        assert kwargs["stderr"] == stderr
+        assert "capture_output" not in kwargs
+
+    @patch("subprocess.run")
+    def test_failure_reports_captured_stderr(self, mock_run, capsys):
+        """At normal verbosity, a failing task's stderr is shown and kept."""
+        mock_run.return_value = MagicMock(returncode=2, stdout=None, stderr="boom")
+
+        task = Task(name="test", command="false")
+        executor = TaskExecutor(task_definitions={"test": task})
+        result = executor.execute_task(task)
+
+        assert result.output == "boom"
+        assert "boom\n" in capsys.readouterr().err
+
+    @patch("subprocess.run")
+    def test_retained_stderr_is_bounded(self, mock_run, capsys):
+        """Long stderr is shown in full but only its last lines are kept."""
+        stderr = "".join(f"line {i}\n" for i in range(MAX_OUTPUT_LINES + 5))
+        mock_run.return_value = MagicMock(returncode=1, stdout=None, stderr=stderr)
+
+        task = Task(name="test", command="false")
+        result = TaskExecutor(task_definitions={"test": task}).execute_task(task)
+
+        assert result.output.splitlines() == stderr.splitlines()[-MAX_OUTPUT_LINES:]
+        assert result.output.endswith("\n")
+        assert stderr in capsys.readouterr().err
+
+
+class TestSpawnArguments:
+    """Tests for subprocess arguments that keep the posix_spawn path open."""
+
+    @patch("subprocess.run")
+    def test_cwd_omitted_when_already_there(self, mock_run, tmp_path, monkeypatch):
+        """No cwd is passed when the task runs in the current directory."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=None, stderr=None)
+        monkeypatch.chdir(tmp_path)
+        task = Task(name="test", command="true", use_venv=False)
+        executor = TaskExecutor(task_definitions={"test": task}, project_root=Path.cwd())
+
+        executor.execute_task(task)
+
+        assert mock_run.call_args.kwargs["cwd"] is None
+        assert mock_run.call_args.kwargs["close_fds"] is False
+
+    @patch("subprocess.run")
+    def test_cwd_passed_for_other_directory(self, mock_run, tmp_path):
+        """A task working_dir is still passed as cwd."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=None, stderr=None)
+        task = Task(name="test", command="true", use_venv=False, working_dir="src")
+        executor = TaskExecutor(task_definitions={"test": task}, project_root=tmp_path)
+
+        executor.execute_task(task)
+
+        assert mock_run.call_args.kwargs["cwd"] == tmp_path / "src"
+
+
+class TestPipelineFusing:
+    """Tests for running compatible pipeline steps in a single shell."""
+
+    def _executor(self, fuse_steps, **tasks):
+        tasks["ci"] = Pipeline(name="ci", steps=list(tasks))
+        return TaskExecutor(task_definitions=tasks, fuse_steps=fuse_steps)
+
+    @patch("subprocess.run")
+    def test_fusing_disabled_by_default(self, mock_run):
+        """Without fuse_steps, each step is its own process."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=None, stderr=None)
+        executor = self._executor(
+            False,
+            lint=Task(name="lint", command="ruff", args=["check"], use_venv=False),
+            test=Task(name="test", command="pytest", use_venv=False),
+        )
+
+        result = executor.run("ci")
+        assert mock_run.call_count == 2
+        assert len(result.results) == 2
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="fusing requires a POSIX shell")
+    @patch("subprocess.run")
+    def test_compatible_steps_run_in_one_shell(self, mock_run):
+        """Consecutive steps with the same env and cwd are fused with &&."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=None, stderr=None)
+        executor = self._executor(
+            True,
+            lint=Task(name="lint", command="ruff", args=["check", "a b"], use_venv=False),
+            test=Task(name="test", command="pytest", use_venv=False),
+        )
+
+        result = executor.run("ci")
+        assert mock_run.call_count == 1
+        assert mock_run.call_args.args[0] == ["/bin/sh", "-c", "ruff check 'a b' && pytest"]
+        assert [r.task_name for r in result.results] == ["lint+test"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="fusing requires a POSIX shell")
+    @patch("subprocess.run")
+    def test_steps_with_different_env_are_not_fused(self, mock_run):
+        """A change of env starts a new group."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=None, stderr=None)
+        executor = self._executor(
+            True,
+            a=Task(name="a", command="true", use_venv=False),
+            b=Task(name="b", command="true", use_venv=False),
+            c=Task(name="c", command="true", use_venv=False, env={"CI": "1"}),
+        )
+
+        result = executor.run("ci")
+        assert [r.task_name for r in result.results] == ["a+b", "c"]
+
+    def test_fast_pipeline_config_enables_fusing(self):
+        """create_executor_from_config reads the fast_pipeline flag."""
+        executor = create_executor_from_config({"fast_pipeline": True, "tasks": {}})
+        assert executor.fuse_steps is True
+
+
+class TestParallelPipelines:
+    """Tests for pipelines whose steps run concurrently."""
+
+    def _executor(self, **definitions):
+        for name in ("lint", "typecheck", "test"):
+            definitions.setdefault(name, Task(name=name, command=name, use_venv=False))
+        return TaskExecutor(task_definitions=definitions)
+
+    def test_steps_run_concurrently(self):
+        """Every step of a parallel pipeline is running at the same time."""
+        executor = self._executor(
+            checks=Pipeline(name="checks", steps=["lint", "typecheck"], parallel=True)
+        )
+        # Each step waits for the other; run in order, this would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def execute(task):
+            barrier.wait()
+            return ExecutionResult(task_name=task.name, exit_code=0)
+
+        with patch.object(executor, "execute_task", side_effect=execute):
+            result = executor.run("checks")
+
+        assert result.success
+        assert [r.task_name for r in result.results] == ["lint", "typecheck"]
+
+    @patch("subprocess.run")
+    def test_nested_parallel_block_then_sequential_step(self, mock_run):
+        """A sequential pipeline runs its parallel block before the next step."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=None, stderr=None)
+        executor = self._executor(
+            checks=Pipeline(name="checks", steps=["lint", "typecheck"], parallel=True),
+            ci=Pipeline(name="ci", steps=["checks", "test"]),
+        )
+
+        result = executor.run("ci")
+
+        assert result.success
+        assert [r.task_name for r in result.results] == ["lint", "typecheck", "test"]
+        assert mock_run.call_count == 3
+
+    def test_failure_stops_later_steps(self):
+        """A failing parallel step short-circuits the rest of the pipeline."""
+        executor = self._executor(
+            checks=Pipeline(name="checks", steps=["lint", "typecheck"], parallel=True),
+            ci=Pipeline(name="ci", steps=["checks", "test"]),
+        )
+
+        def execute(task):
+            return ExecutionResult(task_name=task.name, exit_code=3 if task.name == "lint" else 0)
+
+        with patch.object(executor, "execute_task", side_effect=execute) as mock_execute:
+            result = executor.run("ci")
+
+        assert result.short_circuited
+        assert result.exit_code == 3
+        assert "test" not in [call.args[0].name for call in mock_execute.call_args_list]
+
+    def test_parallel_config_flag(self):
+        """create_executor_from_config reads a pipeline's parallel flag."""
+        executor = create_executor_from_config(
+            {
+                "tasks": {
+                    "checks": {"pipeline": ["lint", "test"], "parallel": True},
+                    "ci": {"pipeline": ["checks"]},
+                }
+            }
+        )
+        assert executor.task_definitions["checks"].parallel is True
+        assert executor.task_definitions["ci"].parallel is False
+
+
+class TestSingleTaskOutcome:
+    """Tests for the messages logged after a single task finishes."""
+
+    @patch("subprocess.run")
+    def test_verbose_failure_is_reported(self, mock_run, capsys):
+        """At verbose output the task runs as a child and its failure is logged."""
+        mock_run.return_value = MagicMock(returncode=1, stdout=None, stderr=None)
+        task = Task(name="fail", command="false", use_venv=False)
+        executor = TaskExecutor(task_definitions={"fail": task}, verbosity=1)
+
+        result = executor.run("fail")
+
+        assert result.exit_code == 1
+        assert "[fail] Failed with exit code 1\n" in capsys.readouterr().err
+
+    @patch("subprocess.run")
+    def test_verbose_success_is_reported(self, mock_run, capsys):
+        """At verbose output a successful task still logs its completion."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=None, stderr=None)
+        task = Task(name="ok", command="true", use_venv=False)
+        executor = TaskExecutor(task_definitions={"ok": task}, verbosity=1)
+
+        executor.run("ok")
+
+        assert "[ok] Completed successfully\n" in capsys.readouterr().err
+
+
 class TestExecutionResult:
     """Tests for ExecutionResult dataclass."""
 
@@ -451,6 +871,15 @@ class TestCreateExecutorFromConfig:
 class TestLogging:
     """Tests for executor logging."""
 
+    def test_default_log_writes_prefixed_line(self, capsys):
+        """Without a callback, each message is one prefixed line on stderr."""
+        executor = TaskExecutor(task_definitions={})
+
+        executor._log("build", "Starting task")
+        executor._log("", "bare")
+
+        assert capsys.readouterr().err == "[build] Starting task\n bare\n"
+
     def test_log_callback_called(self):
         """Log callback is called during execution."""
         logged_messages = []
@@ -2,9 +2,12 @@
 
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from devflow.core import paths
+from devflow.core.cache import get_cache_dir
 from devflow.core.paths import ProjectRootNotFoundError, find_project_root, resolve_path
 
 
@@ -98,6 +101,114 @@ class TestFindProjectRoot:
         assert result.is_absolute()
 
 
+class TestProjectRootCache:
+    """Tests for cached project root detection."""
+
+    def test_cached_lookup_skips_walk(self, tmp_path: Path) -> None:
+        """Should not walk the tree again for a cached start directory."""
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+        subdir = tmp_path / "src"
+        subdir.mkdir()
+
+        assert find_project_root(subdir) == tmp_path
+        with patch.object(paths, "_walk_for_project_root") as mock_walk:
+            assert find_project_root(subdir) == tmp_path
+
+        mock_walk.assert_not_called()
+
+    def test_removed_marker_invalidates_entry(self, tmp_path: Path) -> None:
+        """Should re-walk when the cached marker file disappears."""
+        outer = tmp_path / "outer"
+        inner = outer / "inner"
+        inner.mkdir(parents=True)
+        (outer / "pyproject.toml").write_text("[project]\n")
+        (inner / "devflow.toml").write_text("[devflow]\n")
+
+        assert find_project_root(inner) == inner
+
+        (inner / "devflow.toml").unlink()
+        assert find_project_root(inner) == outer
+
+    def test_use_cache_false_rewalks(self, tmp_path: Path) -> None:
+        """Should ignore the cache when use_cache is False."""
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+        subdir = tmp_path / "pkg"
+        subdir.mkdir()
+        assert find_project_root(subdir) == tmp_path
+
+        # A new, closer marker changes the directory's mtime, so the cached
+        # entry is stale with or without the cache
+        (subdir / "devflow.toml").write_text("[devflow]\n")
+        assert find_project_root(subdir) == subdir
+        assert find_project_root(subdir, use_cache=False) == subdir
+
+    def test_sibling_lookup_stops_at_cached_ancestor(self, tmp_path: Path) -> None:
+        """Should reuse the walk of a sibling directory for shared ancestors."""
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+        first = tmp_path / "pkg" / "a"
+        second = tmp_path / "pkg" / "b"
+        first.mkdir(parents=True)
+        second.mkdir()
+        assert find_project_root(first) == tmp_path
+
+        with patch.object(
+            paths, "_scan_for_markers", wraps=paths._scan_for_markers
+        ) as mock_scan:
+            assert find_project_root(second) == tmp_path
+
+        scanned = [call.args[0] for call in mock_scan.call_args_list]
+        assert scanned == [second]
+
+    def test_entries_from_cached_ancestor_see_intermediate_marker(
+        self, tmp_path: Path
+    ) -> None:
+        """Should notice a marker added between a sibling and the shared root."""
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+        pkg = tmp_path / "pkg"
+        first = pkg / "a"
+        second = pkg / "b"
+        first.mkdir(parents=True)
+        second.mkdir()
+        assert find_project_root(first) == tmp_path
+        # Stops at the cached "pkg" entry, inheriting its directory mtimes
+        assert find_project_root(second) == tmp_path
+
+        (pkg / "devflow.toml").write_text("[devflow]\n")
+
+        assert find_project_root(second) == pkg
+        assert find_project_root(first) == pkg
+
+    def test_cwd_lookup_sees_new_nested_marker(self, tmp_path: Path) -> None:
+        """Should find a closer marker created after a cwd lookup was cached."""
+        outer = tmp_path / "outer"
+        start = outer / "a" / "b"
+        start.mkdir(parents=True)
+        (outer / "pyproject.toml").write_text("[project]\n")
+
+        original_cwd = os.getcwd()
+        try:
+            os.chdir(start)
+            assert find_project_root() == outer.resolve()
+
+            (outer / "a" / "pyproject.toml").write_text("[project]\n")
+            assert find_project_root() == (outer / "a").resolve()
+        finally:
+            os.chdir(original_cwd)
+
+    def test_lookups_are_not_written_to_disk(self, tmp_path: Path) -> None:
+        """Should keep the root cache in memory only."""
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+
+        original_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_path)
+            find_project_root()
+        finally:
+            os.chdir(original_cwd)
+
+        assert not (get_cache_dir() / "roots.json").exists()
+
+
 class TestResolvePath:
     """Tests for resolve_path function."""
 
@@ -3,6 +3,9 @@
 Ownership: Workstream B (task/registry)
 """
 
+import dataclasses
+
+import pytest
 
 from devflow.commands.task import Pipeline, Task, is_pipeline, is_task
 
@@ -59,6 +62,12 @@ class TestTask:
         task2 = Task(name="test", command="pytest", args=["-q"])
         assert task1 != task2
 
+    def test_task_is_immutable(self):
+        """Task fields cannot be reassigned after construction."""
+        task = Task(name="test", command="pytest")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            task.command = "tox"  # type: ignore[misc]
+
 
 class TestPipeline:
     """Tests for the Pipeline dataclass."""
@@ -108,6 +117,12 @@ class TestTypeCheckers:
         task = Task(name="test", command="pytest")
         assert is_pipeline(task) is False
 
+    def test_is_pipeline_class_tag(self):
+        """Task and Pipeline carry an is_pipeline class tag, not a field."""
+        assert Pipeline(name="ci").is_pipeline is True
+        assert Task(name="test", command="pytest").is_pipeline is False
+        assert "is_pipeline" not in {f.name for f in dataclasses.fields(Task)}
+
     def test_is_task_true(self):
         """is_task returns True for Task instances."""
         task = Task(name="test", command="pytest")
@@ -96,6 +96,15 @@ class TestTaskCommand:
         captured = capsys.readouterr()
         assert "test" in captured.out
 
+    def test_print_tasks_one_per_line(self, capsys):
+        """print_tasks prints sorted names one per line, or a notice if none."""
+        cmd = TaskCommand(MockAppContext(tasks={"b": {"command": "x"}, "a": {"command": "y"}}))
+        assert cmd.print_tasks() == 0
+        assert capsys.readouterr().out == "a\nb\n"
+
+        assert TaskCommand(MockAppContext(tasks={})).print_tasks() == 0
+        assert capsys.readouterr().out == "No tasks defined in config.\n"
+
     def test_run_task_not_found(self, capsys):
         """run with nonexistent task returns error."""
         app = MockAppContext(tasks={"test": {"command": "pytest"}})
@@ -151,6 +160,19 @@ class TestTaskCommand:
 
         assert exit_code == 42
 
+    @patch("subprocess.run")
+    def test_run_task_failure_logged_at_verbose(self, mock_run, capsys):
+        """run at -v still reports a failing task after it exits."""
+        mock_run.return_value = MagicMock(returncode=1, stdout=None, stderr=None)
+
+        app = MockAppContext(tasks={"fail": {"command": "false"}}, verbosity=1)
+        cmd = TaskCommand(app)
+
+        exit_code = cmd.run(task_name="fail")
+
+        assert exit_code == 1
+        assert "[fail] Failed with exit code 1" in capsys.readouterr().err
+
     @patch("subprocess.run")
     def test_run_pipeline(self, mock_run):
         """run with pipeline executes all steps."""
@@ -220,3 +242,13 @@ class TestCreateTaskTyperCommand:
             callback(task_name="missing", list_tasks=False)
 
         assert exc_info.value.code == 1
+
+    @patch.object(TaskCommand, "run", side_effect=AssertionError("generic dispatch"))
+    @patch.object(TaskCommand, "run_task", return_value=0)
+    def test_callback_calls_run_task_directly(self, mock_run_task, _mock_run):
+        """The Typer callback bypasses the generic run(**kwargs) entry point."""
+        callback = create_task_typer_command(MockAppContext())
+
+        callback(task_name="test", list_tasks=False)
+
+        mock_run_task.assert_called_once_with("test")